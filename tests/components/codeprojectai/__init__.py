@@ -0,0 +1 @@
+"""CodeProject.AI tests."""
@@ -0,0 +1,277 @@
+"""CodeProject.AI license plate recognition tests."""
+# pylint: disable=protected-access
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import codeprojectai.core as cpai
+import numpy as np
+import pytest
+import requests
+
+from viseron.components.codeprojectai import CONFIG_SCHEMA
+from viseron.components.codeprojectai.const import COMPONENT
+from viseron.components.codeprojectai.license_plate_recognition import (
+    CodeProjectAIALPR,
+    LicensePlateRecognition,
+)
+from viseron.domains.license_plate_recognition import DetectedLicensePlate
+from viseron.helpers import letterbox_resize
+
+from tests.common import MockCamera
+
+CAMERA_IDENTIFIER = "test_camera_identifier"
+CONFIG = CONFIG_SCHEMA(
+    {
+        COMPONENT: {
+            "host": "test_host",
+            "license_plate_recognition": {"cameras": {CAMERA_IDENTIFIER: {}}},
+        }
+    }
+)[COMPONENT]
+
+
+@pytest.fixture(name="lpr")
+def fixture_lpr():
+    """Return a LicensePlateRecognition without a post processor thread."""
+    vis = MagicMock()
+    vis.get_registered_domain.return_value = MockCamera(resolution=(100, 100))
+    with patch("viseron.domains.post_processor.RestartableThread"):
+        lpr = LicensePlateRecognition(vis, CONFIG, CAMERA_IDENTIFIER)
+    yield lpr
+    lpr.stop()
+
+
+def mock_object(rel_x1, rel_y1, rel_x2, rel_y2):
+    """Return a mocked detected object."""
+    return MagicMock(rel_x1=rel_x1, rel_y1=rel_y1, rel_x2=rel_x2, rel_y2=rel_y2)
+
+
+def mock_response(status_code, json=None):
+    """Return a mocked response."""
+    response = MagicMock(status_code=status_code)
+    response.json.return_value = json
+    return response
+
+
+@pytest.mark.parametrize(
+    "height, width",
+    [
+        (40, 100),
+        (100, 40),
+        (51, 50),
+        (50, 50),
+    ],
+)
+def test_pad_to_square(height, width):
+    """Test that padding gives the same image as letterbox_resize."""
+    frame = np.random.randint(0, 255, (height, width, 3), dtype=np.uint8)
+    max_dimension = max(height, width)
+
+    padded = LicensePlateRecognition._pad_to_square(frame)
+
+    assert padded.shape == (max_dimension, max_dimension, 3)
+    np.testing.assert_array_equal(
+        padded, letterbox_resize(frame, max_dimension, max_dimension)
+    )
+
+
+def test_detect():
+    """Test that detect posts the image using the session."""
+    alpr = CodeProjectAIALPR("test_host", 1234, 10, 0.5)
+    result = {"success": True, "predictions": []}
+    with patch.object(
+        requests.Session, "post", return_value=mock_response(200, result)
+    ) as mock_post:
+        assert alpr.detect(b"image") == result
+
+    mock_post.assert_called_once_with(
+        "http://test_host:1234/v1/image/alpr",
+        files={"image": b"image"},
+        data={"min_confidence": 0.5},
+        timeout=10,
+    )
+
+
+@pytest.mark.parametrize(
+    "post_kwargs, error",
+    [
+        ({"return_value": mock_response(404)}, "Bad url supplied"),
+        ({"return_value": mock_response(500)}, "CodeProject.AI Server error: 500"),
+        ({"side_effect": requests.exceptions.Timeout}, "connection timeout"),
+        (
+            {"side_effect": requests.exceptions.ConnectionError},
+            "connection error",
+        ),
+    ],
+)
+def test_detect_error(post_kwargs, error):
+    """Test that errors are raised as CodeProjectAIException."""
+    alpr = CodeProjectAIALPR("test_host", 1234, 10, 0.5)
+    with patch.object(requests.Session, "post", **post_kwargs):
+        with pytest.raises(cpai.CodeProjectAIException, match=error):
+            alpr.detect(b"image")
+
+
+def test_license_plate_recognition(lpr):
+    """Test that results for all objects are merged in object order."""
+    frame = np.zeros((100, 100, 3), dtype=np.uint8)
+    objects = [
+        mock_object(0.1 * i, 0.1 * i, 0.1 * i + 0.1, 0.1 * i + 0.1) for i in range(6)
+    ]
+
+    def process_frame(_frame, bounding_box):
+        return [DetectedLicensePlate(str(bounding_box[0]), 0.9, 0, 0, 1, 1)]
+
+    with patch.object(lpr, "_process_frame", side_effect=process_frame):
+        detections = lpr.license_plate_recognition(
+            frame, MagicMock(filtered_objects=objects)
+        )
+
+    assert [detection.plate for detection in detections] == [
+        str(10 * i) for i in range(6)
+    ]
+
+
+def cpai_result(plate):
+    """Return a CodeProject.AI result with a single plate."""
+    return {
+        "success": True,
+        "predictions": [
+            {
+                "plate": plate,
+                "confidence": 0.9,
+                "x_min": 1,
+                "y_min": 2,
+                "x_max": 3,
+                "y_max": 4,
+            }
+        ],
+    }
+
+
+def random_frame():
+    """Return a random frame."""
+    return np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+
+
+def test_result_cache(lpr):
+    """Test that identical crops reuse the cached result."""
+    frame = random_frame()
+    bounding_box = (10, 10, 50, 50)
+    with patch.object(
+        lpr._cpai, "detect", return_value=cpai_result("ABC123")
+    ) as mock_detect:
+        first = lpr._process_frame(frame, bounding_box)
+        second = lpr._process_frame(frame.copy(), bounding_box)
+
+    assert mock_detect.call_count == 1
+    assert first == second
+    assert first[0].plate == "ABC123"
+
+
+def test_result_cache_different_crops(lpr):
+    """Test that different crops do not share a result."""
+    bounding_box = (10, 10, 50, 50)
+    frame = random_frame()
+    other_frame = frame.copy()
+    other_frame[20, 20] += 1
+    with patch.object(
+        lpr._cpai,
+        "detect",
+        side_effect=[
+            cpai_result("ABC123"),
+            cpai_result("DEF456"),
+            {"success": True, "predictions": []},
+        ],
+    ):
+        assert lpr._process_frame(frame, bounding_box)[0].plate == "ABC123"
+        assert lpr._process_frame(other_frame, bounding_box)[0].plate == "DEF456"
+        # Same crop pixels at another position is not a cache hit either
+        assert not lpr._process_frame(frame, (50, 50, 90, 90))
+
+
+def test_result_cache_empty_result(lpr):
+    """Test that empty results are not cached."""
+    frame = random_frame()
+    bounding_box = (10, 10, 50, 50)
+    with patch.object(
+        lpr._cpai,
+        "detect",
+        side_effect=[{"success": True, "predictions": []}, cpai_result("ABC123")],
+    ) as mock_detect:
+        assert lpr._process_frame(frame, bounding_box) == []
+        assert lpr._process_frame(frame, bounding_box)[0].plate == "ABC123"
+
+    assert mock_detect.call_count == 2
+
+
+def test_result_cache_expire(lpr):
+    """Test that cached results expire."""
+    frame = random_frame()
+    bounding_box = (10, 10, 50, 50)
+    with patch.object(
+        lpr._cpai, "detect", return_value=cpai_result("ABC123")
+    ) as mock_detect, patch(
+        "viseron.components.codeprojectai.license_plate_recognition.time.monotonic",
+        side_effect=[0, lpr._result_cache_ttl + 1, lpr._result_cache_ttl + 1],
+    ):
+        lpr._process_frame(frame, bounding_box)
+        lpr._process_frame(frame, bounding_box)
+
+    assert mock_detect.call_count == 2
+
+
+def test_result_cache_eviction(lpr):
+    """Test that the least recently used result is evicted."""
+    frame = random_frame()
+    with patch.object(lpr._cpai, "detect", return_value=cpai_result("ABC123")), patch(
+        "viseron.components.codeprojectai.license_plate_recognition."
+        "RESULT_CACHE_SIZE",
+        2,
+    ):
+        for i in range(3):
+            lpr._process_frame(frame, (10 * i, 10, 50, 50))
+
+    assert len(lpr._result_cache) == 2
+    assert [key[0] for key in lpr._result_cache] == [10, 20]
+
+
+@pytest.mark.parametrize(
+    "encoding, header",
+    [
+        ("jpeg", b"\xff\xd8"),
+        ("bmp", b"BM"),
+        ("ppm", b"P6"),
+    ],
+)
+def test_encoding(lpr, encoding, header):
+    """Test that crops are sent in the configured encoding."""
+    lpr._encoding = encoding
+    with patch.object(
+        lpr._cpai, "detect", return_value=cpai_result("ABC123")
+    ) as mock_detect:
+        lpr._process_frame(random_frame(), (10, 10, 50, 50))
+
+    assert mock_detect.call_args[0][0].startswith(header)
+
+
+def test_encoding_failed(lpr):
+    """Test that crops that fail to encode are not sent."""
+    with patch.object(lpr, "_encode", return_value=None), patch.object(
+        lpr._cpai, "detect"
+    ) as mock_detect:
+        assert lpr._process_frame(random_frame(), (10, 10, 50, 50)) == []
+
+    mock_detect.assert_not_called()
+
+
+def test_predictions_sorted(lpr):
+    """Test that plates are returned with the highest confidence first."""
+    result = cpai_result("ABC123")
+    result["predictions"].append({**result["predictions"][0], "plate": "DEF456"})
+    result["predictions"][1]["confidence"] = 0.95
+    with patch.object(lpr._cpai, "detect", return_value=result):
+        detections = lpr._process_frame(random_frame(), (10, 10, 50, 50))
+
+    assert [detection.plate for detection in detections] == ["DEF456", "ABC123"]
@@ -0,0 +1 @@
+"""Data stream tests."""
@@ -0,0 +1,136 @@
+"""Test data_stream component."""
+import threading
+import time
+from queue import Queue
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from viseron.components.data_stream import (
+    DATA_QUEUE_SIZE,
+    CallbackWorkerPool,
+    DataStream,
+)
+
+
+@pytest.fixture(name="data_stream")
+def fixture_data_stream():
+    """Return a DataStream without a consumer thread."""
+    with patch("viseron.components.data_stream.RestartableThread"):
+        yield DataStream(MagicMock())
+
+
+def test_callback_worker_pool():
+    """Test that callbacks are run by a bounded number of reused workers."""
+    pool = CallbackWorkerPool(max_workers=2)
+    results = []
+    done = threading.Event()
+
+    def callback(value):
+        results.append(value)
+        if len(results) == 10:
+            done.set()
+
+    for value in range(10):
+        pool.submit(callback, value)
+
+    assert done.wait(timeout=5)
+    assert sorted(results) == list(range(10))
+    assert pool._workers <= 2  # pylint: disable=protected-access
+
+
+def test_callback_worker_pool_exception(caplog):
+    """Test that a failing callback does not stop the worker."""
+    pool = CallbackWorkerPool(max_workers=1)
+    done = threading.Event()
+
+    def failing_callback():
+        raise ValueError("Test error")
+
+    pool.submit(failing_callback)
+    pool.submit(done.set)
+
+    assert done.wait(timeout=5)
+    assert "Error in data stream callback" in caplog.text
+
+
+def test_callback_worker_pool_thread_limit():
+    """Test that callbacks still run when no new worker thread can be started."""
+    pool = CallbackWorkerPool(max_workers=4)
+    done = threading.Event()
+
+    with patch.object(
+        pool, "_start_worker", side_effect=RuntimeError("can't start new thread")
+    ):
+        pool.submit(time.sleep, 0.1)
+        pool.submit(done.set)
+
+    assert done.wait(timeout=5)
+    assert pool._workers == 1  # pylint: disable=protected-access
+    assert pool._max_workers == 1  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize(
+    "subscribe_topic, publish_topic, expected",
+    [
+        ("camera/*/frame", "camera/test/frame", True),
+        ("camera/*/frame", "camera/test/frame/extra", False),
+        ("camera/*", "camera/test/frame", True),
+        ("*/event", "motion/event", True),
+        ("*/event", "motion/events", False),
+    ],
+)
+def test_wildcard_subscriptions(data_stream, subscribe_topic, publish_topic, expected):
+    """Test that wildcard subscribers receive data on matching topics."""
+    queue: Queue = Queue()
+    unique_id = data_stream.subscribe_data(subscribe_topic, queue)
+    try:
+        data_stream.wildcard_subscriptions(
+            {"data_topic": publish_topic, "data": "test_data"}
+        )
+    finally:
+        data_stream.unsubscribe_data(subscribe_topic, unique_id)
+
+    if expected:
+        assert queue.get_nowait() == "test_data"
+    else:
+        assert queue.empty()
+
+
+def test_publish_data_keeps_order(data_stream):
+    """Test that data for related topics is delivered in publish order."""
+    queue: Queue = Queue()
+    unique_id = data_stream.subscribe_data("test_camera/*", queue)
+    topics = ["test_camera/recorder/start", "test_camera/recorder/stop"]
+    try:
+        for value in range(100):
+            data_stream.publish_data(topics[value % 2], value)
+
+        # Related topics are handled by the same consumer
+        data_queue = DataStream._data_queues[  # pylint: disable=protected-access
+            DataStream.consumer_index(topics[0])
+        ]
+        assert DataStream.consumer_index(topics[0]) == DataStream.consumer_index(
+            topics[1]
+        )
+        while data_queue:
+            data_item = data_queue.popleft()
+            data_stream.static_subscriptions(data_item)
+            data_stream.wildcard_subscriptions(data_item)
+        assert [queue.get_nowait() for _ in range(100)] == list(range(100))
+    finally:
+        data_stream.unsubscribe_data("test_camera/*", unique_id)
+
+
+def test_publish_data_drops_oldest(data_stream):
+    """Test that the oldest data is dropped when the data queue is full."""
+    index = DataStream.consumer_index("test_camera/drop")
+    data_queue = DataStream._data_queues[index]  # pylint: disable=protected-access
+    data_queue.clear()
+    for value in range(DATA_QUEUE_SIZE + 10):
+        data_stream.publish_data("test_camera/drop", value)
+
+    assert len(data_queue) == DATA_QUEUE_SIZE
+    assert data_queue[0]["data"] == 10
+    assert DataStream._data_ready[index].is_set()  # pylint: disable=protected-access
+    data_queue.clear()
@@ -1,6 +1,7 @@
 """FFmpeg stream tests."""
 from __future__ import annotations
 
+import io
 from contextlib import nullcontext
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -43,6 +44,7 @@ from viseron.const import (
     ENV_RASPBERRYPI4,
 )
 from viseron.domains.camera.const import CONFIG_EXTENSION
+from viseron.domains.camera.shared_frames import SharedFrames
 from viseron.exceptions import StreamInformationError
 
 from tests.common import MockCamera
@@ -226,3 +228,36 @@ class TestStream:
                 CONFIG_USERNAME
             ] = DEFAULT_USERNAME
             assert stream.get_stream_url(CONFIG) == "rtsp://test_host:1234/"
+
+    @pytest.mark.parametrize(
+        "pipe_bytes, expected",
+        [
+            (bytes(range(6)) * 4, True),
+            (bytes(range(6)), False),
+        ],
+    )
+    def test_read(self, pipe_bytes, expected) -> None:
+        """Test that frames are read from the pipe into shared frames."""
+        mocked_camera = MockCamera(identifier="test_camera_identifier")
+        mocked_camera.shared_frames = SharedFrames()
+        with patch.object(
+            Stream, "__init__", MagicMock(spec=Stream, return_value=None)
+        ), patch.object(Stream, "width", 4), patch.object(Stream, "height", 4):
+            stream = Stream(CONFIG, mocked_camera, "test_camera_identifier")
+            # pylint: disable=protected-access
+            stream._logger = MagicMock()
+            stream._camera = mocked_camera
+            stream._camera_identifier = "test_camera_identifier"
+            stream._pixel_format = "yuv420p"
+            stream._color_plane_width = 4
+            stream._color_plane_height = 6
+            stream._frame_bytes_size = 24
+            stream._pipe = MagicMock(stdout=io.BytesIO(pipe_bytes))
+            shared_frame = stream.read()
+
+        if not expected:
+            assert shared_frame is None
+            return
+        frame = mocked_camera.shared_frames.get_decoded_frame(shared_frame)
+        assert frame.shape == (6, 4)
+        assert frame.tobytes() == pipe_bytes[:24]
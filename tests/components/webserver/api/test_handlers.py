@@ -4,6 +4,7 @@ import json
 from http import HTTPStatus
 from unittest.mock import PropertyMock, patch
 
+import pytest
 import tornado.web
 import voluptuous as vol
 
@@ -79,6 +80,17 @@ class DummyAPIHandler(BaseAPIHandler):
             "supported_methods": ["GET"],
             "method": "test_error",
         },
+        {
+            "requires_auth": False,
+            "path_pattern": r"/request_arguments_echo",
+            "supported_methods": ["GET"],
+            "method": "test_request_arguments",
+            "request_arguments_schema": vol.Schema(
+                {
+                    vol.Required("test_key"): str,
+                }
+            ),
+        },
     ]
 
     def test_get(self):
@@ -93,6 +105,10 @@ class DummyAPIHandler(BaseAPIHandler):
         """Handle error."""
         raise ValueError("Test error")
 
+    def test_request_arguments(self):
+        """Handle request by returning the validated request arguments."""
+        self.response_success(response=self.request_arguments)
+
 
 class TestBaseAPIHandler(TestAppBaseAuth):
     """Test the BaseAPIHandler class."""
@@ -221,6 +237,17 @@ class TestBaseAPIHandler(TestAppBaseAuth):
         assert "Invalid JSON in body" in body["error"]
         assert body["status"] == HTTPStatus.BAD_REQUEST
 
+    def test_json_body_invalid_utf8(self):
+        """Test endpoint with json_body_schema setting and a non UTF-8 body."""
+        response = self.fetch(
+            "/api/v1/json_body_schema",
+            method="POST",
+            body=b"\xff",
+        )
+        assert response.code == HTTPStatus.BAD_REQUEST
+        body = json.loads(response.body)
+        assert "Invalid JSON in body" in body["error"]
+
     def test_request_arguments_schema(self):
         """Test endpoint with request_arguments_schema setting."""
         response = self.fetch(
@@ -241,6 +268,15 @@ class TestBaseAPIHandler(TestAppBaseAuth):
         assert "Invalid request arguments" in body["error"]
         assert body["status"] == HTTPStatus.BAD_REQUEST
 
+    def test_request_arguments_last_value(self):
+        """Test that the last value of a repeated argument is used, stripped."""
+        response = self.fetch(
+            "/api/v1/request_arguments_echo?test_key=first&test_key=%20last%20",
+            method="GET",
+        )
+        assert response.code == HTTPStatus.OK
+        assert json.loads(response.body) == {"test_key": "last"}
+
     def test_requires_camera_token(self):
         """Test endpoint with requires_camera_token setting."""
         mocked_camera = MockCamera(identifier="test_camera_identifier")
@@ -322,3 +358,33 @@ class TestBaseAPIHandler(TestAppBaseAuth):
             "error": "Internal server error",
             "status": HTTPStatus.INTERNAL_SERVER_ERROR,
         }
+
+
+def test_get_compiled_routes():
+    """Test that routes are compiled once per handler class."""
+    # pylint: disable=protected-access
+    compiled_routes = DummyAPIHandler._get_compiled_routes()
+    assert compiled_routes is DummyAPIHandler._get_compiled_routes()
+    assert [route["method"] for _, route in compiled_routes] == [
+        route["method"] for route in DummyAPIHandler.routes
+    ]
+    assert compiled_routes[1][1]["requires_group"] == frozenset({Group.WRITE})
+    assert compiled_routes[0][0].regex.match("/api/v1/test")
+    assert BaseAPIHandler._get_compiled_routes() == []
+
+
+@pytest.mark.parametrize(
+    "path, expected_index",
+    [
+        ("/api/v1/test", 0),
+        ("/api/v1/requires_group", 1),
+        ("/api/v1/camera/test_camera/requires_camera_token", 5),
+        ("/api/v1/camera/requires_camera_token", 6),
+        ("/api/v1/error", 7),
+        ("/api/v1/does_not_exist", len(DummyAPIHandler.routes)),
+    ],
+)
+def test_first_route_index(path, expected_index):
+    """Test that the combined route regex finds the first matching route."""
+    # pylint: disable=protected-access
+    assert DummyAPIHandler._first_route_index(path) == expected_index
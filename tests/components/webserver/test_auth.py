@@ -102,6 +102,12 @@ class TestAuth:
         user_get = self.auth.get_user(user_add.id)
         assert user_add == user_get
 
+    def test_users_loaded(self):
+        """Test users_loaded."""
+        assert self.auth.users_loaded is False
+        assert self.auth.users == {}
+        assert self.auth.users_loaded is True
+
     def test_get_user_by_username(self):
         """Test getting user."""
         user_add = self.auth.add_user("Test", "test", "test", Group.ADMIN)
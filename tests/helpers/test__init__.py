@@ -1,6 +1,9 @@
 """Test helpers module."""
 from contextlib import nullcontext
+from unittest.mock import patch
 
+import cv2
+import numpy as np
 import pytest
 
 from viseron import helpers
@@ -81,3 +84,40 @@ def test_convert_letterboxed_bbox(
         assert converted_bbox == expected
     if message:
         assert str(exception.value) == message
+
+
+@pytest.mark.parametrize("simplejpeg_available", [True, False])
+def test_encode_jpeg(simplejpeg_available):
+    """Test encode_jpeg with and without simplejpeg."""
+    image = np.zeros((32, 48, 3), dtype=np.uint8)
+    image[:, :24] = (255, 0, 0)
+    with patch.object(
+        helpers,
+        "simplejpeg",
+        helpers.simplejpeg if simplejpeg_available else None,
+    ):
+        jpg = helpers.encode_jpeg(image[:, 8:40], quality=80)
+    assert jpg[:2] == b"\xff\xd8"
+    decoded = cv2.imdecode(np.frombuffer(jpg, np.uint8), cv2.IMREAD_COLOR)
+    assert decoded.shape == (32, 32, 3)
+
+
+def test_encode_ppm():
+    """Test encode_ppm."""
+    image = np.zeros((2, 3, 3), dtype=np.uint8)
+    image[0, 0] = (255, 0, 0)
+    ppm = helpers.encode_ppm(image)
+    assert ppm[:11] == b"P6\n3 2\n255\n"
+    assert ppm[11:14] == b"\x00\x00\xff"
+    assert len(ppm) == 11 + 2 * 3 * 3
+
+
+def test_calculate_absolute_coords_array():
+    """Test that array coords match calculate_absolute_coords."""
+    bounding_boxes = np.array([(0.1, 0.2, 0.5, 0.6), (0.333, 0.0, 1.0, 0.999)])
+    assert helpers.calculate_absolute_coords_array(
+        bounding_boxes, (1920, 1080)
+    ).tolist() == [
+        list(helpers.calculate_absolute_coords(tuple(bounding_box), (1920, 1080)))
+        for bounding_box in bounding_boxes
+    ]
@@ -0,0 +1,58 @@
+"""Tests for JSON helpers."""
+import dataclasses
+import datetime
+import json
+from enum import Enum
+
+import pytest
+
+from viseron.helpers.json import JSONEncoder, json_dumps
+
+
+class MockEnum(Enum):
+    """Mock enum."""
+
+    VALUE = "value"
+
+
+@dataclasses.dataclass
+class MockDataclass:
+    """Mock dataclass."""
+
+    name: str
+    value: float
+
+
+@dataclasses.dataclass
+class MockAsDict:
+    """Mock dataclass with as_dict."""
+
+    value: float
+
+    def as_dict(self):
+        """Return as dict."""
+        return {"value": round(self.value, 1)}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"state": "on", "attributes": {"name": "test", "domain": "sensor"}},
+        {"time": datetime.datetime(2023, 1, 2, 3, 4, 5, 6789)},
+        {"time": datetime.datetime(2023, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)},
+        {"duration": datetime.timedelta(seconds=90.5)},
+        {"enum": MockEnum.VALUE},
+        {"dataclass": MockDataclass("test", 0.123)},
+        {"as_dict": [MockAsDict(0.123)]},
+        {1: "non str key"},
+    ],
+)
+def test_json_dumps(data):
+    """Test that json_dumps serializes the same as JSONEncoder."""
+    assert json.loads(json_dumps(data)) == json.loads(json.dumps(data, cls=JSONEncoder))
+
+
+def test_json_dumps_unsupported():
+    """Test that unsupported objects raise TypeError."""
+    with pytest.raises(TypeError):
+        json_dumps({"set": {1, 2}})
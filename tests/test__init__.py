@@ -2,14 +2,17 @@
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from viseron import setup_viseron
 from viseron.components import DomainToSetup
 from viseron.components.nvr.const import (
     COMPONENT as NVR_COMPONENT,
     DOMAIN as NVR_DOMAIN,
 )
-from viseron.const import DOMAINS_TO_SETUP, LOADED
+from viseron.const import DOMAINS_TO_SETUP, LOADED, REGISTERED_DOMAINS
 from viseron.domains.camera.const import DOMAIN as CAMERA_DOMAIN
+from viseron.exceptions import DomainNotRegisteredError
 
 
 def test_setup_viseron_nvr_loaded(caplog):
@@ -136,3 +139,15 @@ def test_setup_viseron_cameras_missing_nvr_loaded(caplog):
     mocked_setup_domains.assert_called_once()
     mocked_load_config.assert_called_once()
     caplog.clear()
+
+
+def test_get_registered_domain_or_none(vis):
+    """Test get_registered_domain_or_none."""
+    camera = MagicMock()
+    vis.data[REGISTERED_DOMAINS] = {CAMERA_DOMAIN: {"test_camera": camera}}
+    assert vis.get_registered_domain_or_none(CAMERA_DOMAIN, "test_camera") is camera
+    assert vis.get_registered_domain(CAMERA_DOMAIN, "test_camera") is camera
+    assert vis.get_registered_domain_or_none(CAMERA_DOMAIN, "missing") is None
+    assert vis.get_registered_domain_or_none(NVR_DOMAIN, "test_camera") is None
+    with pytest.raises(DomainNotRegisteredError):
+        vis.get_registered_domain(CAMERA_DOMAIN, "missing")
@@ -0,0 +1 @@
+"""Watchdog tests."""
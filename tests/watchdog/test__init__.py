@@ -0,0 +1,24 @@
+"""Tests for the watchdog base class."""
+from unittest.mock import patch
+
+from viseron.watchdog import WatchDog
+
+
+def test_get_scheduler():
+    """Test that the scheduler is created lazily and shared."""
+    with patch.object(WatchDog, "_scheduler", None):
+        scheduler = WatchDog._get_scheduler()  # pylint: disable=protected-access
+        try:
+            assert scheduler.running
+            assert (
+                WatchDog._get_scheduler()
+                is scheduler  # pylint: disable=protected-access
+            )
+        finally:
+            scheduler.shutdown()
+        # A stopped scheduler is started again on next use
+        assert (
+            WatchDog._get_scheduler() is scheduler  # pylint: disable=protected-access
+        )
+        assert scheduler.running
+        scheduler.shutdown()
@@ -0,0 +1,227 @@
+"""Tests for the process watchdog."""
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from viseron.watchdog.process_watchdog import ProcessWatchDog, RestartableProcess
+
+
+@pytest.fixture(name="process_watchdog")
+def fixture_process_watchdog():
+    """Return a ProcessWatchDog with an empty registry."""
+    with patch.object(ProcessWatchDog, "registered_items", {}):
+        process_watchdog = ProcessWatchDog()
+        yield process_watchdog
+        process_watchdog.stop()
+        process_watchdog._thread.join()  # pylint: disable=protected-access
+
+
+def _mock_process(alive=False, start_time=0.0, grace_period=20):
+    """Return a mocked RestartableProcess."""
+    process = MagicMock(spec=RestartableProcess)
+    process.name = "test"
+    process.started = True
+    process.is_alive.return_value = alive
+    process.start_time = start_time
+    process.grace_period = grace_period
+    process.grace_deadline = start_time + grace_period
+    return process
+
+
+@pytest.mark.parametrize(
+    "alive, now, restarted",
+    [
+        (False, 30.0, True),
+        (False, 10.0, False),
+        (True, 30.0, False),
+    ],
+)
+def test_watchdog(process_watchdog, alive, now, restarted):
+    """Test that only dead processes past their grace period are restarted."""
+    process = _mock_process(alive=alive)
+    ProcessWatchDog.register(process)
+    with patch("viseron.watchdog.process_watchdog.time.monotonic", return_value=now):
+        process_watchdog.watchdog()
+    assert process.restart.called is restarted
+
+
+def test_watchdog_not_started(process_watchdog):
+    """Test that processes that are not started are ignored."""
+    process = _mock_process()
+    process.started = False
+    ProcessWatchDog.register(process)
+    with patch("viseron.watchdog.process_watchdog.time.monotonic", return_value=30.0):
+        process_watchdog.watchdog()
+    process.restart.assert_not_called()
+
+
+def test_register_unregister(process_watchdog):
+    """Test registering and unregistering processes."""
+    process = _mock_process()
+    ProcessWatchDog.register(process)
+    ProcessWatchDog.register(process)
+    assert list(process_watchdog.registered_items) == [process]
+    ProcessWatchDog.unregister(process)
+    ProcessWatchDog.unregister(process)
+    assert not process_watchdog.registered_items
+
+
+def test_watchdog_grace_period_skips_probe(process_watchdog):
+    """Test that processes inside their grace period are not probed."""
+    process = _mock_process(start_time=100.0)
+    ProcessWatchDog.register(process)
+    with patch("viseron.watchdog.process_watchdog.time.monotonic", return_value=110.0):
+        process_watchdog.watchdog()
+    process.is_alive.assert_not_called()
+    process.restart.assert_not_called()
+
+
+def test_restartable_process_forwarded_attributes():
+    """Test pid and sentinel before and after the process is created."""
+    with patch("viseron.watchdog.process_watchdog.mp.get_context") as mock_ctx:
+        restartable_process = RestartableProcess(name="test", register=False)
+        assert restartable_process.pid is None
+        assert restartable_process.sentinel is None
+
+        mock_ctx.return_value.Process.return_value.pid = 1234
+        mock_ctx.return_value.Process.return_value.sentinel = 5
+        restartable_process.start()
+    assert restartable_process.pid == 1234
+    assert restartable_process.sentinel == 5
+
+
+def test_grace_deadline():
+    """Test that the grace deadline is computed when the process starts."""
+    with patch("viseron.watchdog.process_watchdog.mp.get_context"), patch(
+        "viseron.watchdog.process_watchdog.time.monotonic", return_value=100.0
+    ):
+        restartable_process = RestartableProcess(
+            name="test", grace_period=30, register=False
+        )
+        assert restartable_process.grace_deadline is None
+        restartable_process.start()
+    assert restartable_process.grace_deadline == 130.0
+
+
+@pytest.mark.parametrize("alive_after_terminate", [True, False])
+def test_restart(alive_after_terminate):
+    """Test that restart only kills processes that ignore terminate."""
+    with patch("viseron.watchdog.process_watchdog.mp.get_context") as mock_ctx:
+        restartable_process = RestartableProcess(name="test", register=False)
+        mock_ctx.return_value.Process.side_effect = [MagicMock(), MagicMock()]
+        restartable_process.start()
+        old_process = restartable_process.process
+        old_process.is_alive.side_effect = [True, alive_after_terminate, False]
+        restartable_process.restart()
+
+    old_process.terminate.assert_called_once()
+    old_process.join.assert_any_call(timeout=5.0)
+    assert old_process.kill.called is alive_after_terminate
+    old_process.close.assert_called_once()
+    assert restartable_process.process is not old_process
+    assert restartable_process.started
+
+
+def test_restart_exited_process():
+    """Test that restarting an exited process skips terminate and kill."""
+    with patch("viseron.watchdog.process_watchdog.mp.get_context") as mock_ctx:
+        restartable_process = RestartableProcess(name="test", register=False)
+        mock_ctx.return_value.Process.side_effect = [MagicMock(), MagicMock()]
+        restartable_process.start()
+        old_process = restartable_process.process
+        old_process.is_alive.return_value = False
+        restartable_process.restart()
+
+    old_process.terminate.assert_not_called()
+    old_process.join.assert_not_called()
+    old_process.kill.assert_not_called()
+    old_process.close.assert_called_once()
+    assert restartable_process.process is not old_process
+
+
+def test_restart_real_process():
+    """Test restarting a real process."""
+    restartable_process = RestartableProcess(
+        target=time.sleep, args=(10,), name="test", register=False, daemon=True
+    )
+    restartable_process.start()
+    old_pid = restartable_process.pid
+    try:
+        restartable_process.restart(timeout=1)
+        assert restartable_process.pid != old_pid
+        assert restartable_process.is_alive()
+    finally:
+        restartable_process.kill()
+        restartable_process.join(timeout=1)
+
+
+def test_watchdog_interval():
+    """Test that the watchdog runs every interval until stopped."""
+    with patch(
+        "viseron.watchdog.process_watchdog.WATCHDOG_INTERVAL", 0.01
+    ), patch.object(ProcessWatchDog, "watchdog") as mock_watchdog, patch.object(
+        ProcessWatchDog, "_get_scheduler"
+    ) as mock_get_scheduler:
+        process_watchdog = ProcessWatchDog()
+        time.sleep(0.1)
+        process_watchdog.stop()
+        process_watchdog._thread.join()  # pylint: disable=protected-access
+    assert mock_watchdog.call_count > 1
+    mock_get_scheduler.assert_not_called()
+
+
+def test_restartable_process_getattr():
+    """Test attribute forwarding to the wrapped process."""
+    with patch("viseron.watchdog.process_watchdog.mp.get_context") as mock_ctx:
+        restartable_process = RestartableProcess(name="test", register=False)
+        with pytest.raises(AttributeError):
+            restartable_process.authkey  # pylint: disable=pointless-statement
+
+        mock_ctx.return_value.Process.return_value.authkey = b"test"
+        restartable_process.start()
+    assert restartable_process.authkey == b"test"
+    with pytest.raises(AttributeError):
+        restartable_process._missing  # pylint: disable=pointless-statement
+    # Instances use __slots__, so unknown attributes cannot be set
+    assert not hasattr(restartable_process, "__dict__")
+    with pytest.raises(AttributeError):
+        restartable_process.missing = True
+
+
+def test_watchdog_stopped(process_watchdog):
+    """Test that a stopped watchdog does not restart processes."""
+    process = _mock_process()
+    ProcessWatchDog.register(process)
+    process_watchdog.stop()
+    with patch("viseron.watchdog.process_watchdog.time.monotonic", return_value=30.0):
+        process_watchdog.watchdog()
+    process.restart.assert_not_called()
+
+
+def test_watchdog_logs_once(process_watchdog, caplog):
+    """Test that simultaneously dead processes are logged in a single record."""
+    processes = [_mock_process() for _ in range(3)]
+    for process in processes:
+        ProcessWatchDog.register(process)
+    with patch("viseron.watchdog.process_watchdog.time.monotonic", return_value=30.0):
+        process_watchdog.watchdog()
+    for process in processes:
+        process.restart.assert_called_once()
+    assert len(caplog.records) == 1
+    assert "3 processes have exited" in caplog.text
+
+
+def test_watchdog_restart_failure(process_watchdog, caplog):
+    """Test that a failed restart is logged and does not stop other restarts."""
+    failing_process = _mock_process()
+    failing_process.name = "failing"
+    failing_process.restart.side_effect = RuntimeError("restart failed")
+    process = _mock_process()
+    ProcessWatchDog.register(failing_process)
+    ProcessWatchDog.register(process)
+    with patch("viseron.watchdog.process_watchdog.time.monotonic", return_value=30.0):
+        process_watchdog.watchdog()
+    failing_process.restart.assert_called_once()
+    process.restart.assert_called_once()
+    assert "Failed to restart process failing" in caplog.text
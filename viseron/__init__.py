@@ -365,16 +365,22 @@ class Viseron:
     def get_registered_domain(self, domain: SupportedDomains, identifier: str):
         """Return a registered domain with a specific identifier."""
         if (
-            domain in self.data[REGISTERED_DOMAINS]
-            and identifier in self.data[REGISTERED_DOMAINS][domain]
-        ):
-            return self.data[REGISTERED_DOMAINS][domain][identifier]
+            registered_domain := self.get_registered_domain_or_none(domain, identifier)
+        ) is not None:
+            return registered_domain
 
         raise DomainNotRegisteredError(
             domain,
             identifier=identifier,
         )
 
+    def get_registered_domain_or_none(self, domain: SupportedDomains, identifier: str):
+        """Return a registered domain with a specific identifier or None if missing.
+
+        Same as get_registered_domain but without raising DomainNotRegisteredError.
+        """
+        return self.data[REGISTERED_DOMAINS].get(domain, {}).get(identifier, None)
+
     @overload
     def get_registered_identifiers(
         self, domain: Literal["camera"]
@@ -10,7 +10,7 @@ from viseron.domains.face_recognition import (
     BASE_CONFIG_SCHEMA as FACE_RECOGNITION_BASE_CONFIG_SCHEMA,
 )
 from viseron.domains.license_plate_recognition import (
-    BASE_CONFIG_SCHEMA as LICENSE_PLATE_RECOGNITION_SCHEMA,
+    BASE_CONFIG_SCHEMA as LICENSE_PLATE_RECOGNITION_BASE_CONFIG_SCHEMA,
 )
 from viseron.domains.motion_detector.const import DOMAIN as MOTION_DETECTOR_DOMAIN
 from viseron.domains.object_detector import (
@@ -23,9 +23,11 @@ from viseron.helpers.validators import Maybe
 from .const import (
     COMPONENT,
     CONFIG_CUSTOM_MODEL,
+    CONFIG_ENCODING,
     CONFIG_FACE_RECOGNITION,
     CONFIG_HOST,
     CONFIG_IMAGE_SIZE,
+    CONFIG_JPEG_QUALITY,
     CONFIG_LICENSE_PLATE_RECOGNITION,
     CONFIG_MIN_CONFIDENCE,
     CONFIG_OBJECT_DETECTOR,
@@ -33,22 +35,27 @@ from .const import (
     CONFIG_TIMEOUT,
     CONFIG_TRAIN,
     DEFAULT_CUSTOM_MODEL,
+    DEFAULT_ENCODING,
     DEFAULT_IMAGE_SIZE,
+    DEFAULT_JPEG_QUALITY,
     DEFAULT_MIN_CONFIDENCE,
     DEFAULT_PORT,
     DEFAULT_TIMEOUT,
     DEFAULT_TRAIN,
     DESC_COMPONENT,
     DESC_CUSTOM_MODEL,
+    DESC_ENCODING,
     DESC_FACE_RECOGNITION,
     DESC_HOST,
     DESC_IMAGE_SIZE,
+    DESC_JPEG_QUALITY,
     DESC_LICENSE_PLATE_RECOGNITION,
     DESC_MIN_CONFIDENCE,
     DESC_OBJECT_DETECTOR,
     DESC_PORT,
     DESC_TIMEOUT,
     DESC_TRAIN,
+    ENCODINGS,
 )
 
 LOGGER = logging.getLogger(__name__)
@@ -79,6 +86,21 @@ FACE_RECOGNITION_SCHEMA = FACE_RECOGNITION_BASE_CONFIG_SCHEMA.extend(
     }
 )
 
+LICENSE_PLATE_RECOGNITION_SCHEMA = LICENSE_PLATE_RECOGNITION_BASE_CONFIG_SCHEMA.extend(
+    {
+        vol.Optional(
+            CONFIG_ENCODING,
+            default=DEFAULT_ENCODING,
+            description=DESC_ENCODING,
+        ): vol.In(ENCODINGS),
+        vol.Optional(
+            CONFIG_JPEG_QUALITY,
+            default=DEFAULT_JPEG_QUALITY,
+            description=DESC_JPEG_QUALITY,
+        ): vol.All(int, vol.Range(min=1, max=100)),
+    }
+)
+
 CONFIG_SCHEMA = vol.Schema(
     {
         vol.Required(COMPONENT, description=DESC_COMPONENT): vol.Schema(
@@ -51,3 +51,27 @@ DESC_TRAIN = (
     "Disable this when you have a good model trained."
 )
 DESC_MIN_CONFIDENCE = "Minimum confidence for a face to be considered a match."
+
+# LICENSE_PLATE_RECOGNITION_SCHEMA constants
+CONFIG_ENCODING = "encoding"
+CONFIG_JPEG_QUALITY = "jpeg_quality"
+
+ENCODING_JPEG = "jpeg"
+ENCODING_BMP = "bmp"
+ENCODING_PPM = "ppm"
+ENCODINGS = [ENCODING_JPEG, ENCODING_BMP, ENCODING_PPM]
+
+DEFAULT_ENCODING = ENCODING_JPEG
+DEFAULT_JPEG_QUALITY = 75
+
+DESC_ENCODING = (
+    "Image format used when sending license plate crops to CodeProject.AI. "
+    "<code>bmp</code> and <code>ppm</code> skip compression entirely which is faster "
+    "when CodeProject.AI runs on the same host or on a fast LAN, at the cost of much "
+    "larger requests. Keep <code>jpeg</code> if CodeProject.AI runs on a remote "
+    "server or over a slow network."
+)
+DESC_JPEG_QUALITY = (
+    "JPEG quality used when <code>encoding</code> is <code>jpeg</code>. "
+    "Lower values reduce encoding time and request size."
+)
@@ -1,36 +1,55 @@
 """CodeProject.AI license plate recognition."""
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http import HTTPStatus
+from itertools import chain
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
 import codeprojectai.core as cpai
 import cv2
 import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
 
+from viseron.const import VISERON_SIGNAL_SHUTDOWN
 from viseron.domains.license_plate_recognition import (
     AbstractLicensePlateRecognition,
     DetectedLicensePlate,
 )
-from viseron.helpers import calculate_absolute_coords, letterbox_resize
+from viseron.domains.license_plate_recognition.const import CONFIG_EXPIRE_AFTER
+from viseron.helpers import calculate_absolute_coords_array, encode_jpeg, encode_ppm
 
 from .const import (
     COMPONENT,
+    CONFIG_ENCODING,
     CONFIG_HOST,
+    CONFIG_JPEG_QUALITY,
     CONFIG_LICENSE_PLATE_RECOGNITION,
     CONFIG_MIN_CONFIDENCE,
     CONFIG_PORT,
     CONFIG_TIMEOUT,
+    ENCODING_BMP,
+    ENCODING_PPM,
     PLATE_RECOGNITION_URL_BASE,
 )
 
 if TYPE_CHECKING:
     from viseron import Viseron
-    from viseron.domains.object_detector.detected_object import DetectedObject
     from viseron.domains.post_processor import PostProcessorFrame
 
 LOGGER = logging.getLogger(__name__)
 
+RESULT_CACHE_SIZE = 128
+MAX_CONCURRENT_REQUESTS = 4
+
 
 def setup(vis: Viseron, config, identifier) -> bool:
     """Set up the codeprojectai license_plate_recognition domain."""
@@ -48,6 +67,10 @@ class LicensePlateRecognition(AbstractLicensePlateRecognition):
         )
 
         self._cpai_config = config
+        self._encoding = config[CONFIG_LICENSE_PLATE_RECOGNITION][CONFIG_ENCODING]
+        self._jpeg_quality = config[CONFIG_LICENSE_PLATE_RECOGNITION][
+            CONFIG_JPEG_QUALITY
+        ]
         self._cpai = CodeProjectAIALPR(
             host=config[CONFIG_HOST],
             port=config[CONFIG_PORT],
@@ -56,6 +79,21 @@ class LicensePlateRecognition(AbstractLicensePlateRecognition):
                 CONFIG_MIN_CONFIDENCE
             ],
         )
+        self._executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_REQUESTS,
+            thread_name_prefix=f"{__name__}.{camera_identifier}",
+        )
+        vis.register_signal_handler(VISERON_SIGNAL_SHUTDOWN, self.stop)
+        # Results are only reused for identical crops at the same position, and for
+        # no longer than a recognition result is kept alive
+        self._result_cache_ttl = config[CONFIG_LICENSE_PLATE_RECOGNITION][
+            CONFIG_EXPIRE_AFTER
+        ]
+        self._result_cache: OrderedDict[
+            tuple[int, int, int, int, bytes],
+            tuple[float, list[DetectedLicensePlate]],
+        ] = OrderedDict()
+        self._result_cache_lock = threading.Lock()
 
     def preprocess(self, post_processor_frame: PostProcessorFrame) -> np.ndarray:
         """Perform preprocessing of frame before running recognition."""
@@ -63,34 +101,95 @@ class LicensePlateRecognition(AbstractLicensePlateRecognition):
             post_processor_frame.shared_frame
         )
 
+    def _encode(self, frame: np.ndarray) -> bytes | None:
+        """Encode frame to the configured image format."""
+        if self._encoding == ENCODING_BMP:
+            ret, bmp = cv2.imencode(".bmp", frame)
+            return bmp.tobytes() if ret else None
+        if self._encoding == ENCODING_PPM:
+            return encode_ppm(frame)
+        return encode_jpeg(frame, self._jpeg_quality)
+
+    @staticmethod
+    def _pad_to_square(frame: np.ndarray) -> np.ndarray:
+        """Pad frame with black borders to a centered square.
+
+        Pads the frame view directly, which produces the same image as
+        letterbox_resize would, without copying and resizing first.
+        """
+        height, width, _ = frame.shape
+        max_dimension = max(width, height)
+        top = (max_dimension - height) // 2
+        left = (max_dimension - width) // 2
+        return cv2.copyMakeBorder(
+            frame,
+            top,
+            max_dimension - height - top,
+            left,
+            max_dimension - width - left,
+            cv2.BORDER_CONSTANT,
+            value=(0, 0, 0),
+        )
+
+    def _get_cached_result(
+        self, key: tuple[int, int, int, int, bytes]
+    ) -> list[DetectedLicensePlate] | None:
+        """Return cached result for key if it exists and has not expired."""
+        with self._result_cache_lock:
+            if (cached := self._result_cache.get(key)) is None:
+                return None
+            timestamp, detections = cached
+            if time.monotonic() - timestamp > self._result_cache_ttl:
+                del self._result_cache[key]
+                return None
+            self._result_cache.move_to_end(key)
+            return detections
+
+    def _cache_result(
+        self,
+        key: tuple[int, int, int, int, bytes],
+        detections: list[DetectedLicensePlate],
+    ) -> None:
+        """Store result in cache, evicting the least recently used entry."""
+        with self._result_cache_lock:
+            self._result_cache[key] = (time.monotonic(), detections)
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
     def _process_frame(
-        self, frame: np.ndarray, detected_object: DetectedObject
+        self, frame: np.ndarray, bounding_box: tuple[int, int, int, int]
     ) -> list[DetectedLicensePlate]:
         """Process frame."""
         detections: list[DetectedLicensePlate] = []
-        x1, y1, x2, y2 = calculate_absolute_coords(
-            (
-                detected_object.rel_x1,
-                detected_object.rel_y1,
-                detected_object.rel_x2,
-                detected_object.rel_y2,
-            ),
-            self._camera.resolution,
+        x1, y1, x2, y2 = bounding_box
+        cropped_frame = self._pad_to_square(frame[y1:y2, x1:x2])
+
+        cache_key = (
+            x1,
+            y1,
+            x2,
+            y2,
+            hashlib.blake2b(cropped_frame, digest_size=16).digest(),
         )
-        cropped_frame = frame[y1:y2, x1:x2].copy()
-        width, height, _ = cropped_frame.shape
-        max_dimension = max(width, height)
-        cropped_frame = letterbox_resize(cropped_frame, max_dimension, max_dimension)
+        if (cached := self._get_cached_result(cache_key)) is not None:
+            self._logger.debug("Using cached license plate recognition result")
+            return list(cached)
+
+        if (image_bytes := self._encode(cropped_frame)) is None:
+            self._logger.error(
+                "Failed to encode license plate crop to %s", self._encoding
+            )
+            return detections
 
         try:
-            result = self._cpai.detect(cv2.imencode(".jpg", cropped_frame)[1].tobytes())
+            result = self._cpai.detect(image_bytes)
         except cpai.CodeProjectAIException as error:
             self._logger.error("Error calling CodeProject.AI: %s", error)
             return detections
 
         self._logger.debug("License plate recognition result: %s", result)
 
-        if not result["success"]:
+        if not result["success"] or not result["predictions"]:
             return detections
 
         detections.extend(
@@ -103,19 +202,51 @@ class LicensePlateRecognition(AbstractLicensePlateRecognition):
                 detection["y_max"],
             )
             for detection in sorted(
-                result["predictions"], key=lambda x: x["confidence"]
+                result["predictions"], key=itemgetter("confidence"), reverse=True
             )
         )
+        # Empty results are not cached so that a missed plate is retried on the
+        # next frame instead of sticking while the object stays in place
+        if detections and self._result_cache_ttl:
+            self._cache_result(cache_key, detections)
         return detections
 
     def license_plate_recognition(
         self, frame: np.ndarray, post_processor_frame: PostProcessorFrame
     ) -> list[DetectedLicensePlate]:
         """Perform license plate recognition."""
-        detections = []
-        for detected_object in post_processor_frame.filtered_objects:
-            detections += self._process_frame(frame, detected_object)
-        return detections
+        objects = post_processor_frame.filtered_objects
+        if not objects:
+            return []
+
+        bounding_boxes = calculate_absolute_coords_array(
+            np.array(
+                [
+                    (
+                        detected_object.rel_x1,
+                        detected_object.rel_y1,
+                        detected_object.rel_x2,
+                        detected_object.rel_y2,
+                    )
+                    for detected_object in objects
+                ]
+            ),
+            self._camera.resolution,
+        ).tolist()
+        if len(bounding_boxes) == 1:
+            return self._process_frame(frame, bounding_boxes[0])
+
+        # Send requests for multiple objects concurrently so latency does not grow
+        # with the number of objects in the frame
+        return list(
+            chain.from_iterable(
+                self._executor.map(partial(self._process_frame, frame), bounding_boxes)
+            )
+        )
+
+    def stop(self) -> None:
+        """Stop license plate recognition."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
 
 class CodeProjectAIALPR:
@@ -133,12 +264,42 @@ class CodeProjectAIALPR:
         self.min_confidence = min_confidence
 
         self._url_base = PLATE_RECOGNITION_URL_BASE.format(host=host, port=port)
+        # Reuse connections between requests. The pool is sized to fit all
+        # concurrent requests so that no connections are discarded
+        self._session = requests.Session()
+        self._session.mount(
+            "http://", HTTPAdapter(pool_maxsize=MAX_CONCURRENT_REQUESTS)
+        )
 
     def detect(self, image_bytes: bytes):
-        """Process image_bytes and detect."""
-        return cpai.process_image(
-            url=self._url_base,
-            image_bytes=image_bytes,
-            min_confidence=self.min_confidence,
-            timeout=self.timeout,
+        """Process image_bytes and detect.
+
+        Same as codeprojectai.core.process_image, but using a persistent session.
+        """
+        try:
+            response = self._session.post(
+                self._url_base,
+                files={"image": image_bytes},
+                data={"min_confidence": self.min_confidence},
+                timeout=self.timeout,
+            )
+        except requests.exceptions.Timeout as error:
+            raise cpai.CodeProjectAIException(
+                "CodeProject.AI Server connection timeout. "
+                f"Current timeout is {self.timeout} seconds, try increasing this"
+            ) from error
+        except requests.exceptions.ConnectionError as error:
+            raise cpai.CodeProjectAIException(
+                f"CodeProject.AI Server connection error, check your IP and port: {error}"
+            ) from error
+
+        if response.status_code == HTTPStatus.OK:
+            return response.json()
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            raise cpai.CodeProjectAIException(
+                f"Bad url supplied, url {self._url_base} raised error "
+                f"{HTTPStatus.NOT_FOUND}"
+            )
+        raise cpai.CodeProjectAIException(
+            f"CodeProject.AI Server error: {response.status_code}"
         )
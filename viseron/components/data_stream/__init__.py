@@ -4,11 +4,14 @@ from __future__ import annotations
 import fnmatch
 import logging
 import multiprocessing as mp
-import subprocess
+import os
+import re
+import resource
 import threading
-import time
 import uuid
-from queue import Queue
+from collections import deque
+from queue import Queue, SimpleQueue
+from re import Pattern
 from typing import Any, Callable, TypedDict
 
 from tornado.ioloop import IOLoop
@@ -19,9 +22,26 @@ from viseron.watchdog.thread_watchdog import RestartableThread
 
 COMPONENT = "data_stream"
 
+MAX_CALLBACK_WORKERS = 256
+MIN_CONSUMER_THREADS = 2
+MAX_CONSUMER_THREADS = 4
+DATA_QUEUE_SIZE = 1000
+
 LOGGER = logging.getLogger(__name__)
 
 
+def _get_consumer_threads() -> int:
+    """Return number of consumer threads based on the CPUs available to Viseron."""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return min(max(MIN_CONSUMER_THREADS, cpus // 2), MAX_CONSUMER_THREADS)
+
+
+CONSUMER_THREADS = _get_consumer_threads()
+
+
 class DataSubscriber(TypedDict):
     """Data subscriber type."""
 
@@ -43,6 +63,67 @@ class Publish(TypedDict):
     data: Any
 
 
+class CallbackWorkerPool:
+    """Pool of daemon threads that run subscriber callbacks.
+
+    Workers are started on demand up to max_workers and are then reused, so a new
+    thread is not created for every callback. One worker is started up front and
+    always runs, so queued callbacks are never left without a worker.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._max_workers = max_workers
+        self._queue: SimpleQueue = SimpleQueue()
+        self._idle_semaphore = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._workers = 1
+        self._start_worker(1)
+
+    def _start_worker(self, worker_number: int) -> None:
+        """Start a worker thread."""
+        threading.Thread(
+            target=self._worker,
+            name=f"data_stream_callback_{worker_number}",
+            daemon=True,
+        ).start()
+
+    def submit(self, callback: Callable, *args) -> None:
+        """Queue callback to be run by a worker."""
+        self._queue.put((callback, args))
+        if self._idle_semaphore.acquire(timeout=0):
+            return
+
+        with self._lock:
+            if self._workers >= self._max_workers:
+                return
+            self._workers += 1
+            worker_number = self._workers
+
+        try:
+            self._start_worker(worker_number)
+        except RuntimeError as err:
+            if "can't start new thread" not in str(err):
+                raise
+            # The first worker is always running, so the callback will still be run
+            with self._lock:
+                self._workers -= 1
+                self._max_workers = self._workers
+            LOGGER.debug(
+                "Unable to start new thread, limiting callback workers to %s",
+                self._max_workers,
+            )
+
+    def _worker(self) -> None:
+        """Run queued callbacks."""
+        while True:
+            callback, args = self._queue.get()
+            try:
+                callback(*args)
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception(f"Error in data stream callback {callback}")
+            self._idle_semaphore.release()
+
+
 def setup(vis, _) -> bool:
     """Set up the data_stream component."""
     vis.data[COMPONENT] = DataStream(vis)
@@ -57,50 +138,72 @@ class DataStream:
     A data topic can have any value.
     You can subscribe to wildcard topics using '*', eg topic/*/event_name
 
-    Data is published to topics using a thread.
+    Data is published to topics using consumer threads. Topics are assigned to a
+    consumer by their first path segment, so all topics for a camera
+    ({camera_identifier}/...) share a consumer, as do all events (event/...).
+    Data is delivered in publish order within such a group, eg a recorder stop event
+    can never be delivered before the start event. There is no ordering guarantee
+    between groups.
+
+    Subscriber dicts are never mutated in place. Subscribing and unsubscribing
+    replaces them with updated copies, which lets the consumers iterate them without
+    copying on every publish.
     """
 
-    _subscribers: dict[str, Any] = {}
-    _wildcard_subscribers: dict[str, Any] = {}
-    _data_queue: Queue = Queue(maxsize=1000)
+    _subscribers: dict[str, dict[uuid.UUID, DataSubscriber]] = {}
+    _wildcard_subscribers: dict[
+        str, tuple[Pattern[str], dict[uuid.UUID, DataSubscriber]]
+    ] = {}
+    _subscribers_lock = threading.Lock()
+    # Bounded deques drop the oldest item when full. Each has an Event that is set
+    # when data is available, which is cheaper than the Condition used by Queue
+    _data_queues: list[deque[dict[str, Any]]] = [
+        deque(maxlen=DATA_QUEUE_SIZE) for _ in range(CONSUMER_THREADS)
+    ]
+    _data_ready: list[threading.Event] = [
+        threading.Event() for _ in range(CONSUMER_THREADS)
+    ]
 
     def __init__(self, vis) -> None:
         self._vis = vis
         self._max_threads = self._get_max_threads()
         LOGGER.debug(f"Max threads: {self._max_threads}")
-
-        data_consumer = RestartableThread(
-            name="data_stream", target=self.consume_data, daemon=True, register=True
+        self._callback_pool = CallbackWorkerPool(
+            min(self._max_threads, MAX_CALLBACK_WORKERS)
         )
-        data_consumer.start()
+
+        for index in range(CONSUMER_THREADS):
+            data_consumer = RestartableThread(
+                name=f"data_stream.{index}",
+                target=self.consume_data,
+                args=(index,),
+                daemon=True,
+                register=True,
+            )
+            data_consumer.start()
 
     def _get_max_threads(self) -> int:
         """Get the maximum number of threads allowed."""
-        command = ["ulimit", "-u"]
-        result = subprocess.run(
-            command, shell=True, capture_output=True, text=True, check=False
-        )
-
-        # Check if the command executed successfully
-        if result.returncode == 0:
-            ulimit_output = result.stdout.strip()
-            LOGGER.debug(f"ulimit -u output: {ulimit_output}")
-        else:
-            LOGGER.error(f"Error executing ulimit -u command: {result.stderr}")
-            return 999999
-
-        try:
-            return int(ulimit_output)
-        except ValueError:
+        soft_limit, _hard_limit = resource.getrlimit(resource.RLIMIT_NPROC)
+        LOGGER.debug(f"RLIMIT_NPROC soft limit: {soft_limit}")
+        if soft_limit == resource.RLIM_INFINITY:
             return 999999
+        return soft_limit
 
     @staticmethod
     def publish_data(data_topic: str, data: Any = None) -> None:
         """Publish data to topic."""
         # LOGGER.debug(f"Publishing to data topic {data_topic}, {data}")
-        helpers.pop_if_full(
-            DataStream._data_queue, {"data_topic": data_topic, "data": data}
-        )
+        index = DataStream.consumer_index(data_topic)
+        DataStream._data_queues[index].append({"data_topic": data_topic, "data": data})
+        data_ready = DataStream._data_ready[index]
+        if not data_ready.is_set():
+            data_ready.set()
+
+    @staticmethod
+    def consumer_index(data_topic: str) -> int:
+        """Return index of the consumer that handles data_topic."""
+        return hash(data_topic.partition("/")[0]) % CONSUMER_THREADS
 
     @staticmethod
     def subscribe_data(
@@ -113,30 +216,46 @@ class DataStream:
         LOGGER.debug(f"Subscribing to data topic {data_topic}, {callback}")
         unique_id = uuid.uuid4()
 
-        if "*" in data_topic:
-            DataStream._wildcard_subscribers.setdefault(data_topic, {})[
-                unique_id
-            ] = DataSubscriber(
-                callback=callback,
-                ioloop=ioloop,
-            )
-            return unique_id
+        subscriber = DataSubscriber(callback=callback, ioloop=ioloop)
 
-        DataStream._subscribers.setdefault(data_topic, {})[unique_id] = DataSubscriber(
-            callback=callback,
-            ioloop=ioloop,
-        )
+        with DataStream._subscribers_lock:
+            if "*" in data_topic:
+                if data_topic in DataStream._wildcard_subscribers:
+                    pattern, callbacks = DataStream._wildcard_subscribers[data_topic]
+                else:
+                    # Compile the pattern once here instead of in fnmatch on every
+                    # publish
+                    pattern, callbacks = re.compile(fnmatch.translate(data_topic)), {}
+                DataStream._wildcard_subscribers = {
+                    **DataStream._wildcard_subscribers,
+                    data_topic: (pattern, {**callbacks, unique_id: subscriber}),
+                }
+                return unique_id
+
+            DataStream._subscribers[data_topic] = {
+                **DataStream._subscribers.get(data_topic, {}),
+                unique_id: subscriber,
+            }
         return unique_id
 
     @staticmethod
     def unsubscribe_data(data_topic: str, unique_id: uuid.UUID) -> None:
         """Unsubscribe from a topic using the Unique ID returned from subscribe_data."""
         LOGGER.debug(f"Unsubscribing from data topic {data_topic}, {unique_id}")
-        if "*" in data_topic:
-            DataStream._wildcard_subscribers[data_topic].pop(unique_id)
-            return
-
-        DataStream._subscribers[data_topic].pop(unique_id)
+        with DataStream._subscribers_lock:
+            if "*" in data_topic:
+                pattern, callbacks = DataStream._wildcard_subscribers[data_topic]
+                callbacks = callbacks.copy()
+                callbacks.pop(unique_id)
+                DataStream._wildcard_subscribers = {
+                    **DataStream._wildcard_subscribers,
+                    data_topic: (pattern, callbacks),
+                }
+                return
+
+            callbacks = DataStream._subscribers[data_topic].copy()
+            callbacks.pop(unique_id)
+            DataStream._subscribers[data_topic] = callbacks
 
     def run_callbacks(
         self,
@@ -144,40 +263,12 @@ class DataStream:
         data: Any,
     ) -> None:
         """Run callbacks or put to queues."""
-        for callback in callbacks.copy().values():
+        for callback in callbacks.values():
             if callable(callback["callback"]) and callback["ioloop"] is None:
                 if data:
-                    thread = threading.Thread(
-                        target=callback["callback"],
-                        args=(data,),
-                        daemon=True,
-                    )
+                    self._callback_pool.submit(callback["callback"], data)
                 else:
-                    thread = threading.Thread(
-                        target=callback["callback"],
-                        daemon=True,
-                    )
-
-                while True:
-                    # Check if we can start a new thread
-                    active_threads = threading.active_count()
-                    if active_threads > self._max_threads:
-                        time.sleep(0.01)
-                        continue
-
-                    try:
-                        thread.start()
-                    except RuntimeError as err:
-                        if "can't start new thread" in str(err):
-                            LOGGER.debug(
-                                "Unable to start new thread, "
-                                "Max threads: %s, Active threads: %s",
-                                self._max_threads,
-                                active_threads,
-                            )
-                            self._max_threads = int(active_threads * 0.95)
-                            continue
-                    break
+                    self._callback_pool.submit(callback["callback"])
                 continue
 
             if callable(callback["callback"]):
@@ -207,25 +298,28 @@ class DataStream:
 
     def static_subscriptions(self, data_item: dict[str, Any]) -> None:
         """Run callbacks for static subscriptions."""
-        self.run_callbacks(
-            DataStream._subscribers.get(data_item["data_topic"], {}),
-            data_item["data"],
-        )
+        if callbacks := DataStream._subscribers.get(data_item["data_topic"]):
+            self.run_callbacks(callbacks, data_item["data"])
 
     def wildcard_subscriptions(self, data_item: dict[str, Any]) -> None:
         """Run callbacks for wildcard subscriptions."""
-        for data_topic, callbacks in DataStream._wildcard_subscribers.copy().items():
-            if fnmatch.fnmatch(data_item["data_topic"], data_topic):
-                # LOGGER.debug(
-                #     f"Got data on topic {data_item['data_topic']} "
-                #     f"matching with subscriber on topic {data_topic}"
-                # )
-
+        data_topic = data_item["data_topic"]
+        for pattern, callbacks in DataStream._wildcard_subscribers.values():
+            if callbacks and pattern.match(data_topic):
                 self.run_callbacks(callbacks, data_item["data"])
 
-    def consume_data(self) -> None:
-        """Publish data to topics."""
+    def consume_data(self, index: int) -> None:
+        """Publish data from the data queue with the given index to topics."""
+        data_queue = DataStream._data_queues[index]
+        data_ready = DataStream._data_ready[index]
         while True:
-            data_item = self._data_queue.get()
+            try:
+                data_item = data_queue.popleft()
+            except IndexError:
+                data_ready.clear()
+                # Data might have been added before the event was cleared
+                if not data_queue:
+                    data_ready.wait()
+                continue
             self.static_subscriptions(data_item)
             self.wildcard_subscriptions(data_item)
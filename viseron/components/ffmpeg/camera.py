@@ -1,7 +1,6 @@
 """FFmpeg camera."""
 from __future__ import annotations
 
-import datetime
 import os
 import time
 from threading import Event
@@ -125,6 +124,8 @@ from .const import (
     DESC_WIDTH,
     FFMPEG_LOGLEVELS,
     HWACCEL_VAAPI,
+    PIPE_RESTART_BACKOFF_MAX,
+    PIPE_RESTART_BACKOFF_MIN,
     STREAM_FORMAT_MAP,
 )
 from .recorder import Recorder
@@ -251,10 +252,9 @@ RECORDER_SCHEMA = BASE_RECORDER_SCHEMA.extend(
     }
 )
 
-CAMERA_SCHEMA = BASE_CAMERA_CONFIG_SCHEMA.extend(STREAM_SCEHMA_DICT)
-
-CAMERA_SCHEMA = CAMERA_SCHEMA.extend(
+CAMERA_SCHEMA = BASE_CAMERA_CONFIG_SCHEMA.extend(
     {
+        **STREAM_SCEHMA_DICT,
         vol.Required(CONFIG_HOST, description=DESC_HOST): str,
         vol.Optional(
             CONFIG_USERNAME, default=DEFAULT_USERNAME, description=DESC_USERNAME
@@ -298,6 +298,12 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
+# OpenCL usage is a process wide setting, so it is enabled once on import instead of
+# for every camera
+if cv2.ocl.haveOpenCL():
+    cv2.ocl.setUseOpenCL(True)
+
+
 def setup(vis: Viseron, config, identifier) -> bool:
     """Set up the ffmpeg camera domain."""
     try:
@@ -311,7 +317,7 @@ class Camera(AbstractCamera):
     """Represents a camera which is consumed via FFmpeg."""
 
     def __init__(self, vis: Viseron, config, identifier) -> None:
-        self._poll_timer = datetime.datetime.now().timestamp()
+        self._poll_timer = time.monotonic()
         self._frame_reader = None
         # Stream must be initialized before super().__init__ is called as it raises
         # FFprobeError/FFprobeTimeout which is caught in setup() and re-raised as
@@ -323,9 +329,8 @@ class Camera(AbstractCamera):
         self._thread_stuck = False
         self.resolution = None
         self.decode_error = Event()
+        self._stop_event = Event()
 
-        if cv2.ocl.haveOpenCL():
-            cv2.ocl.setUseOpenCL(True)
         vis.data[COMPONENT][self.identifier] = self
         self._recorder = Recorder(vis, config, self)
 
@@ -359,17 +364,20 @@ class Camera(AbstractCamera):
     def read_frames(self) -> None:
         """Read frames from camera."""
         self.decode_error.clear()
-        self._poll_timer = datetime.datetime.now().timestamp()
+        self._poll_timer = time.monotonic()
         empty_frames = 0
+        restart_backoff = PIPE_RESTART_BACKOFF_MIN
         self._thread_stuck = False
 
         self.stream.start_pipe()
 
         while self._capture_frames:
             if self.decode_error.is_set():
-                self._poll_timer = datetime.datetime.now().timestamp()
+                self._poll_timer = time.monotonic()
                 self.connected = False
-                time.sleep(5)
+                if self._stop_event.wait(restart_backoff):
+                    break
+                restart_backoff = min(restart_backoff * 2, PIPE_RESTART_BACKOFF_MAX)
                 self._logger.error("Restarting frame pipe")
                 self.stream.close_pipe()
                 self.stream.start_pipe()
@@ -380,7 +388,8 @@ class Camera(AbstractCamera):
             if self.current_frame:
                 self.connected = True
                 empty_frames = 0
-                self._poll_timer = datetime.datetime.now().timestamp()
+                restart_backoff = PIPE_RESTART_BACKOFF_MIN
+                self._poll_timer = time.monotonic()
                 self._data_stream.publish_data(
                     self.frame_bytes_topic, self.current_frame
                 )
@@ -411,7 +420,7 @@ class Camera(AbstractCamera):
 
     def poll_method(self) -> bool:
         """Return true on frame timeout for RestartableThread to trigger a restart."""
-        now = datetime.datetime.now().timestamp()
+        now = time.monotonic()
 
         # Make sure we timeout at some point if we never get the first frame.
         if now - self._poll_timer > (DEFAULT_FRAME_TIMEOUT * 2):
@@ -438,6 +447,7 @@ class Camera(AbstractCamera):
         """Start capturing frames from camera."""
         self._logger.debug("Starting capture thread")
         self._capture_frames = True
+        self._stop_event.clear()
         if not self._frame_reader or not self._frame_reader.is_alive():
             self._frame_reader = self._create_frame_reader()
             self._frame_reader.start()
@@ -450,6 +460,7 @@ class Camera(AbstractCamera):
         """Release the connection to the camera."""
         self._logger.debug("Stopping capture thread")
         self._capture_frames = False
+        self._stop_event.set()
         if self._frame_reader:
             self._frame_reader.stop()
             self._frame_reader.join(timeout=5)
@@ -16,6 +16,11 @@ STREAM_FORMAT_MAP = {
 
 RECORDER = "recorder"
 
+# Seconds to wait before restarting the frame pipe after a decode error, doubled
+# for each consecutive failure
+PIPE_RESTART_BACKOFF_MIN = 0.25
+PIPE_RESTART_BACKOFF_MAX = 5.0
+
 CAMERA_SEGMENT_DURATION = 5
 CAMERA_SEGMENT_ARGS = [
     "-f",
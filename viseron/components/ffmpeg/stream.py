@@ -8,6 +8,7 @@ import subprocess as sp
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from tenacity import (
     Retrying,
     before_sleep_log,
@@ -464,21 +465,31 @@ class Stream:
         if self._pipe:
             return self._pipe.poll()
 
+    def read_into(self, buffer: np.ndarray) -> int:
+        """Read a single frame from FFmpeg pipe into buffer.
+
+        Returns the number of bytes read.
+        """
+        if self._pipe and self._pipe.stdout:
+            return self._pipe.stdout.readinto(buffer)
+        return 0
+
     def read(self):
         """Return a single frame from FFmpeg pipe."""
         try:
-            if self._pipe and self._pipe.stdout:
-                frame_bytes = self._pipe.stdout.read(self._frame_bytes_size)
-                if len(frame_bytes) == self._frame_bytes_size:
-                    shared_frame = SharedFrame(
-                        self._color_plane_width,
-                        self._color_plane_height,
-                        self._pixel_format,
-                        (self.width, self.height),
-                        self._camera_identifier,
-                    )
-                    self._camera.shared_frames.create(shared_frame, frame_bytes)
-                    return shared_frame
+            # The pipe is read straight into the array that is stored in
+            # SharedFrames, so the frame is never copied after leaving the pipe
+            frame = np.empty(self._frame_bytes_size, np.uint8)
+            if self.read_into(frame) == self._frame_bytes_size:
+                shared_frame = SharedFrame(
+                    self._color_plane_width,
+                    self._color_plane_height,
+                    self._pixel_format,
+                    (self.width, self.height),
+                    self._camera_identifier,
+                )
+                self._camera.shared_frames.create(shared_frame, frame)
+                return shared_frame
         except Exception as err:  # pylint: disable=broad-except
             self._logger.error(f"Error reading frame from pipe: {err}")
         return None
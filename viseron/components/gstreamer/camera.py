@@ -272,6 +272,12 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
+# OpenCL usage is a process wide setting, so it is enabled once on import instead of
+# for every camera
+if cv2.ocl.haveOpenCL():
+    cv2.ocl.setUseOpenCL(True)
+
+
 def setup(vis: Viseron, config, identifier) -> bool:
     """Set up the gstreamer camera domain."""
     try:
@@ -298,8 +304,6 @@ class Camera(AbstractCamera):
         self.resolution = None
         self.decode_error = Event()
 
-        if cv2.ocl.haveOpenCL():
-            cv2.ocl.setUseOpenCL(True)
         vis.data[COMPONENT][self.identifier] = self
         self._recorder = Recorder(vis, config, self)
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 import logging
 import threading
 from queue import Empty, Queue
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Sequence
 
 import paho.mqtt.client as mqtt
 import voluptuous as vol
@@ -24,6 +24,8 @@ from .const import (
     CONFIG_CLIENT_ID,
     CONFIG_DISCOVERY_PREFIX,
     CONFIG_HOME_ASSISTANT,
+    CONFIG_IMAGE_ENCODING,
+    CONFIG_JPEG_QUALITY,
     CONFIG_LAST_WILL_TOPIC,
     CONFIG_PASSWORD,
     CONFIG_PORT,
@@ -31,6 +33,8 @@ from .const import (
     CONFIG_USERNAME,
     DEFAULT_CLIENT_ID,
     DEFAULT_DISCOVERY_PREFIX,
+    DEFAULT_IMAGE_ENCODING,
+    DEFAULT_JPEG_QUALITY,
     DEFAULT_LAST_WILL_TOPIC,
     DEFAULT_PASSWORD,
     DEFAULT_PORT,
@@ -41,12 +45,15 @@ from .const import (
     DESC_COMPONENT,
     DESC_DISCOVERY_PREFIX,
     DESC_HOME_ASSISTANT,
+    DESC_IMAGE_ENCODING,
+    DESC_JPEG_QUALITY,
     DESC_LAST_WILL_TOPIC,
     DESC_PASSWORD,
     DESC_PORT,
     DESC_RETAIN_CONFIG,
     DESC_USERNAME,
     EVENT_MQTT_ENTITY_ADDED,
+    IMAGE_ENCODINGS,
     INCLUSION_GROUP_AUTHENTICATION,
     MESSAGE_AUTHENTICATION,
     MQTT_CLIENT_CONNECTION_OFFLINE,
@@ -129,6 +136,16 @@ CONFIG_SCHEMA = vol.Schema(
                         CONFIG_HOME_ASSISTANT,
                         description=DESC_HOME_ASSISTANT,
                     ): vol.All(CoerceNoneToDict(), HOME_ASSISTANT_SCHEMA),
+                    vol.Optional(
+                        CONFIG_JPEG_QUALITY,
+                        default=DEFAULT_JPEG_QUALITY,
+                        description=DESC_JPEG_QUALITY,
+                    ): vol.All(int, vol.Range(min=1, max=100)),
+                    vol.Optional(
+                        CONFIG_IMAGE_ENCODING,
+                        default=DEFAULT_IMAGE_ENCODING,
+                        description=DESC_IMAGE_ENCODING,
+                    ): vol.In(IMAGE_ENCODINGS),
                 },
                 get_lwt_topic,
             )
@@ -292,21 +309,26 @@ class MQTT:
 
     def publish(self, payload: PublishPayload) -> None:
         """Put payload in publish queue."""
-        self._publish_queue.put(payload)
+        self._publish_queue.put((payload,))
+
+    def publish_many(self, payloads: Sequence[PublishPayload]) -> None:
+        """Put multiple payloads in publish queue as a single item."""
+        self._publish_queue.put(payloads)
 
     def publisher(self) -> None:
         """Publish thread."""
         while not self._kill_received:
             try:
-                message: PublishPayload = self._publish_queue.get(timeout=1)
+                messages: Sequence[PublishPayload] = self._publish_queue.get(timeout=1)
             except Empty:
                 continue
 
-            self._client.publish(
-                message.topic,
-                payload=message.payload,
-                retain=message.retain,
-            )
+            for message in messages:
+                self._client.publish(
+                    message.topic,
+                    payload=message.payload,
+                    retain=message.retain,
+                )
 
     def state_changed(self, event_data: Event) -> None:
         """Relay entity state change to MQTT."""
@@ -44,12 +44,20 @@ CONFIG_PASSWORD = "password"
 CONFIG_CLIENT_ID = "client_id"
 CONFIG_HOME_ASSISTANT = "home_assistant"
 CONFIG_LAST_WILL_TOPIC = "last_will_topic"
+CONFIG_JPEG_QUALITY = "jpeg_quality"
+CONFIG_IMAGE_ENCODING = "image_encoding"
+
+IMAGE_ENCODING_JPEG = "jpeg"
+IMAGE_ENCODING_PPM = "ppm"
+IMAGE_ENCODINGS = [IMAGE_ENCODING_JPEG, IMAGE_ENCODING_PPM]
 
 DEFAULT_PORT = 1883
 DEFAULT_USERNAME: Final = None
 DEFAULT_PASSWORD: Final = None
 DEFAULT_CLIENT_ID = "viseron"
 DEFAULT_LAST_WILL_TOPIC: Final = None
+DEFAULT_JPEG_QUALITY = 95
+DEFAULT_IMAGE_ENCODING = IMAGE_ENCODING_JPEG
 
 DESC_BROKER = "IP address or hostname of MQTT broker."
 DESC_PORT = "Port the broker is listening on."
@@ -63,6 +71,16 @@ DESC_HOME_ASSISTANT = (
     "See <a href=#home-assistant-mqtt-discovery>Home Assistant MQTT Discovery.</a>"
 )
 DESC_LAST_WILL_TOPIC = "Last will topic."
+DESC_JPEG_QUALITY = (
+    "JPEG quality of images published to MQTT when <code>image_encoding</code> is "
+    "<code>jpeg</code>. Lower values reduce encoding time and payload size."
+)
+DESC_IMAGE_ENCODING = (
+    "Image format of images published to MQTT. <code>ppm</code> skips compression "
+    "entirely which is much faster to encode, at the cost of payloads that are many "
+    "times larger. Only use <code>ppm</code> if the broker and its subscribers are "
+    "on the same host or a fast LAN, and the subscribers can decode PPM images."
+)
 
 INCLUSION_GROUP_AUTHENTICATION = "authentication"
 
@@ -1,14 +1,12 @@
 """MQTT entity."""
 from __future__ import annotations
 
-import json
-from functools import partial
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from viseron.components.mqtt.const import COMPONENT as MQTT_COMPONENT, CONFIG_CLIENT_ID
 from viseron.components.mqtt.helpers import PublishPayload
 from viseron.helpers.entity import Entity
-from viseron.helpers.json import JSONEncoder
+from viseron.helpers.json import json_dumps
 
 if TYPE_CHECKING:
     from viseron import Viseron
@@ -26,27 +24,49 @@ class MQTTEntity(Generic[T]):
         self.entity = entity
 
         self._mqtt: MQTT = vis.data[MQTT_COMPONENT]
+        # Topics never change during the lifetime of an entity
+        self._base_topic = (
+            f"{self._config[CONFIG_CLIENT_ID]}/{self.entity.domain}/"
+            f"{self.entity.object_id}"
+        )
+        self._state_topic = f"{self._base_topic}/state"
+        # State, attributes and JSON payload of the last publish
+        self._last_payload: tuple[Any, dict[Any, Any], bytes] | None = None
 
     @property
     def state_topic(self) -> str:
         """Return state topic."""
-        return (
-            f"{self._config[CONFIG_CLIENT_ID]}/{self.entity.domain}/"
-            f"{self.entity.object_id}/state"
-        )
+        return self._state_topic
 
     @property
     def attributes_topic(self):
         """Return attributes topic."""
         return self.state_topic
 
+    def _state_payload(self) -> bytes:
+        """Return state and attributes as JSON.
+
+        The previous payload is reused if state and attributes are unchanged.
+        """
+        state = self.entity.state
+        attributes = self.entity.attributes
+        if (
+            self._last_payload is not None
+            and self._last_payload[0] == state
+            and self._last_payload[1] == attributes
+        ):
+            return self._last_payload[2]
+
+        payload = json_dumps({"state": state, "attributes": attributes})
+        self._last_payload = (state, attributes, payload)
+        return payload
+
     def publish_state(self) -> None:
         """Publish state to MQTT."""
-        payload = {"state": self.entity.state, "attributes": self.entity.attributes}
         self._mqtt.publish(
             PublishPayload(
                 self.state_topic,
-                partial(json.dumps, cls=JSONEncoder, allow_nan=False)(payload),
+                self._state_payload(),
                 retain=True,
             )
         )
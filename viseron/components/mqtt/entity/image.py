@@ -1,59 +1,81 @@
 """MQTT image entity."""
-import json
+from __future__ import annotations
 
-import cv2
+from typing import TYPE_CHECKING
 
-from viseron.components.mqtt.const import CONFIG_CLIENT_ID
+from viseron.components.mqtt.const import (
+    CONFIG_IMAGE_ENCODING,
+    CONFIG_JPEG_QUALITY,
+    IMAGE_ENCODING_PPM,
+)
 from viseron.components.mqtt.helpers import PublishPayload
+from viseron.helpers import encode_jpeg, encode_ppm
 from viseron.helpers.entity.image import ImageEntity
+from viseron.helpers.json import json_dumps
 
 from . import MQTTEntity
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from viseron import Viseron
+
 
 class ImageMQTTEntity(MQTTEntity[ImageEntity]):
     """Base image MQTT entity class."""
 
-    @property
-    def state_topic(self) -> str:
-        """Return state topic."""
-        return (
-            f"{self._config[CONFIG_CLIENT_ID]}/{self.entity.domain}/"
-            f"{self.entity.object_id}/image"
-        )
+    def __init__(self, vis: Viseron, config, entity: ImageEntity) -> None:
+        super().__init__(vis, config, entity)
+        self._state_topic = f"{self._base_topic}/image"
+        self._attributes_topic = f"{self._base_topic}/attributes"
+        # Last published image and its encoded bytes. Holding a reference to the
+        # image makes sure the identity check can't match a new array
+        self._last_image: tuple[np.ndarray, bytes | None] | None = None
 
     @property
     def attributes_topic(self) -> str:
         """Return attributes topic."""
-        return (
-            f"{self._config[CONFIG_CLIENT_ID]}/{self.entity.domain}/"
-            f"{self.entity.object_id}/attributes"
-        )
+        return self._attributes_topic
+
+    def _encode(self, image: np.ndarray) -> bytes | None:
+        """Encode image using the configured image encoding."""
+        if self._config[CONFIG_IMAGE_ENCODING] == IMAGE_ENCODING_PPM:
+            return encode_ppm(image)
+        return encode_jpeg(image, self._config[CONFIG_JPEG_QUALITY])
 
     def _create_bytes_image(self):
-        """Return numpy image as jpg bytes."""
-        if self.entity.image is not None:
-            ret, jpg = cv2.imencode(".jpg", self.entity.image)
-            if ret:
-                return jpg.tobytes()
-        return None
+        """Return numpy image as encoded bytes.
+
+        The previous bytes are reused if the image has not changed.
+        """
+        image = self.entity.image
+        if image is None:
+            self._last_image = None
+            return None
+
+        if self._last_image is not None and self._last_image[0] is image:
+            return self._last_image[1]
+
+        image_bytes = self._encode(image)
+        self._last_image = (image, image_bytes)
+        return image_bytes
 
     def publish_state(self) -> None:
         """Publish state to MQTT."""
         image = self._create_bytes_image()
 
-        self._mqtt.publish(
-            PublishPayload(
-                self.state_topic,
-                image,
-                retain=True,
-            )
-        )
-
         payload = {"attributes": self.entity.attributes}
-        self._mqtt.publish(
-            PublishPayload(
-                self.attributes_topic,
-                json.dumps(payload),
-                retain=True,
+        self._mqtt.publish_many(
+            (
+                PublishPayload(
+                    self.state_topic,
+                    image,
+                    retain=True,
+                ),
+                PublishPayload(
+                    self.attributes_topic,
+                    json_dumps(payload),
+                    retain=True,
+                ),
             )
         )
@@ -3,7 +3,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from viseron.components.mqtt.const import CONFIG_CLIENT_ID
 from viseron.components.mqtt.helpers import SubscribeTopic
 from viseron.const import STATE_OFF, STATE_ON
 from viseron.helpers.entity.toggle import ToggleEntity
@@ -19,6 +18,7 @@ class ToggleMQTTEntity(MQTTEntity[ToggleEntity]):
 
     def __init__(self, vis: Viseron, config, entity: ToggleEntity) -> None:
         super().__init__(vis, config, entity)
+        self._command_topic = f"{self._base_topic}/command"
         self._mqtt.subscribe(
             SubscribeTopic(topic=self.command_topic, callback=self.command_handler)
         )
@@ -26,10 +26,7 @@ class ToggleMQTTEntity(MQTTEntity[ToggleEntity]):
     @property
     def command_topic(self) -> str:
         """Return command topic."""
-        return (
-            f"{self._config[CONFIG_CLIENT_ID]}/{self.entity.domain}/"
-            f"{self.entity.object_id}/command"
-        )
+        return self._command_topic
 
     def command_handler(self, message) -> None:
         """Handle commands on the command topic."""
@@ -1,13 +1,14 @@
 """API handlers."""
 from __future__ import annotations
 
-import json
 import logging
-from functools import partial
+import re
 from http import HTTPStatus
+from itertools import islice
 from re import Pattern
 from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
+import orjson
 import tornado.routing
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
@@ -16,7 +17,7 @@ from voluptuous.schema_builder import Schema
 from viseron.components.webserver.api.const import API_BASE
 from viseron.components.webserver.auth import Group
 from viseron.components.webserver.request_handler import ViseronRequestHandler
-from viseron.helpers.json import JSONEncoder
+from viseron.helpers.json import json_dumps
 
 if TYPE_CHECKING:
     from typing_extensions import NotRequired
@@ -26,12 +27,15 @@ if TYPE_CHECKING:
 LOGGER = logging.getLogger(__name__)
 
 METHOD_ALLOWED_GROUPS = {
-    "GET": [Group.ADMIN, Group.WRITE, Group.READ],
-    "POST": [Group.ADMIN, Group.WRITE],
-    "PUT": [Group.ADMIN, Group.WRITE],
-    "DELETE": [Group.ADMIN, Group.WRITE],
+    "GET": frozenset({Group.ADMIN, Group.WRITE, Group.READ}),
+    "POST": frozenset({Group.ADMIN, Group.WRITE}),
+    "PUT": frozenset({Group.ADMIN, Group.WRITE}),
+    "DELETE": frozenset({Group.ADMIN, Group.WRITE}),
 }
 
+BEARER_PREFIX = "Bearer "
+NAMED_GROUP_REGEX = re.compile(r"\(\?P<\w+>")
+
 
 class Route(TypedDict):
     """Routes type."""
@@ -41,7 +45,7 @@ class Route(TypedDict):
     method: str
     requires_auth: NotRequired[bool]
     requires_camera_token: NotRequired[bool]
-    requires_group: NotRequired[list[Group]]
+    requires_group: NotRequired[list[Group] | frozenset[Group]]
     json_body_schema: NotRequired[Schema]
     request_arguments_schema: NotRequired[Schema]
 
@@ -50,6 +54,51 @@ class BaseAPIHandler(ViseronRequestHandler):
     """Base handler for all API endpoints."""
 
     routes: list[Route] = []
+    _compiled_routes: list[tuple[tornado.routing.PathMatches, Route]]
+    _routes_regex: Pattern
+
+    @classmethod
+    def _get_compiled_routes(cls) -> list[tuple[tornado.routing.PathMatches, Route]]:
+        """Return routes with their path patterns compiled.
+
+        The patterns are compiled once per handler class since routes is a class
+        attribute.
+        """
+        if "_compiled_routes" not in cls.__dict__:
+            cls._compiled_routes = [
+                (
+                    tornado.routing.PathMatches(f"{API_BASE}{route['path_pattern']}"),
+                    cls._freeze_route(route),
+                )
+                for route in cls.routes
+            ]
+            # Named groups are made non-capturing since names can repeat across
+            # routes. Alternatives are tried in order so the first matching route
+            # wins, same as a linear scan
+            cls._routes_regex = re.compile(
+                "|".join(
+                    f"(?P<route_{index}>"
+                    f"{NAMED_GROUP_REGEX.sub('(?:', path_match.regex.pattern)})"
+                    for index, (path_match, _) in enumerate(cls._compiled_routes)
+                )
+            )
+        return cls._compiled_routes
+
+    @staticmethod
+    def _freeze_route(route: Route) -> Route:
+        """Return a copy of route with requires_group as a frozenset."""
+        if (requires_group := route.get("requires_group", None)) is None:
+            return route
+        return {**route, "requires_group": frozenset(requires_group)}
+
+    @classmethod
+    def _first_route_index(cls, path: str) -> int:
+        """Return index of the first route matching path using a single regex."""
+        compiled_routes = cls._get_compiled_routes()
+        match = cls._routes_regex.match(path)
+        if match is None or match.lastgroup is None:
+            return len(compiled_routes)
+        return int(match.lastgroup.rpartition("_")[2])
 
     def initialize(self, vis: Viseron) -> None:
         """Initialize."""
@@ -82,7 +131,7 @@ class BaseAPIHandler(ViseronRequestHandler):
                 self.set_header(header, value)
 
         if isinstance(response, dict):
-            self.finish(partial(json.dumps, cls=JSONEncoder, allow_nan=False)(response))
+            self.finish(json_dumps(response))
             return
 
         self.finish(response)
@@ -107,28 +156,33 @@ class BaseAPIHandler(ViseronRequestHandler):
         """Validate JSON body."""
         if schema := route.get("json_body_schema", None):
             try:
-                json_body = json.loads(self.request.body)
-            except json.JSONDecodeError:
+                json_body = orjson.loads(self.request.body)
+            except orjson.JSONDecodeError:
                 self.response_error(
                     HTTPStatus.BAD_REQUEST,
-                    reason=f"Invalid JSON in body: {self.request.body.decode()}",
+                    reason=f"Invalid JSON in body: {self._body_text()}",
                 )
                 return False
 
             try:
                 self.json_body = schema(json_body)
             except vol.Invalid as err:
+                body = self._body_text()
                 LOGGER.error(
-                    f"Invalid body: {self.request.body.decode()}",
+                    f"Invalid body: {body}",
                     exc_info=True,
                 )
                 self.response_error(
                     HTTPStatus.BAD_REQUEST,
-                    reason=f"Invalid body: {self.request.body.decode()}. {humanize_error(json_body, err)}",
+                    reason=f"Invalid body: {body}. {humanize_error(json_body, err)}",
                 )
                 return False
         return True
 
+    def _body_text(self) -> str:
+        """Return request body decoded for error messages."""
+        return self.request.body.decode("utf-8", "replace")
+
     def _construct_jwt_from_cookies(self) -> str | None:
         """Construct JWT from cookies."""
         signature = self.get_secure_cookie("signature_cookie")
@@ -150,29 +204,25 @@ class BaseAPIHandler(ViseronRequestHandler):
             return False
 
         # Check correct auth header format
-        try:
-            auth_type, auth_val = auth_header.split(" ", 1)
-        except ValueError:
-            LOGGER.debug("Invalid auth header")
-            return False
-        if auth_type != "Bearer":
-            LOGGER.debug(f"Auth type not Bearer: {auth_type}")
+        if not auth_header.startswith(BEARER_PREFIX):
+            LOGGER.debug("Invalid auth header, auth type not Bearer")
             return False
 
         return self.validate_access_token(
-            auth_val, check_refresh_token=self.browser_request
+            auth_header[len(BEARER_PREFIX) :], check_refresh_token=self.browser_request
         )
 
     def route_request(self) -> None:
         """Route request to correct API endpoint."""
         unsupported_method = False
-
-        for route in self.routes:
-            path_match = tornado.routing.PathMatches(
-                f"{API_BASE}{route['path_pattern']}"
-            )
-            if path_match.regex.match(self.request.path):
-                if self.request.method not in route["supported_methods"]:
+        method = self.request.method
+        path = self.request.path
+
+        for path_match, route in islice(
+            self._get_compiled_routes(), self._first_route_index(path), None
+        ):
+            if path_match.regex.match(path):
+                if method not in route["supported_methods"]:
                     unsupported_method = True
                     continue
 
@@ -194,8 +244,9 @@ class BaseAPIHandler(ViseronRequestHandler):
                         if self.current_user.group not in requires_group:
                             LOGGER.debug(
                                 "Request with invalid permissions, endpoint requires"
-                                f" {requires_group}, user is in group"
-                                f" {self.current_user.group}"
+                                " %s, user is in group %s",
+                                requires_group,
+                                self.current_user.group,
                             )
                             self.response_error(
                                 HTTPStatus.FORBIDDEN, reason="Insufficient permissions"
@@ -203,12 +254,13 @@ class BaseAPIHandler(ViseronRequestHandler):
                             return
                     elif (
                             self.current_user.group
-                            not in METHOD_ALLOWED_GROUPS[self.request.method]
+                            not in METHOD_ALLOWED_GROUPS[method]
                         ):
                         LOGGER.debug(
                             "Request with invalid permissions, endpoint requires"
-                            f" {METHOD_ALLOWED_GROUPS[self.request.method]}, user"
-                            f" is in group {self.current_user.group}"
+                            " %s, user is in group %s",
+                            METHOD_ALLOWED_GROUPS[method],
+                            self.current_user.group,
                         )
                         self.response_error(
                             HTTPStatus.FORBIDDEN, reason="Insufficient permissions"
@@ -219,15 +271,20 @@ class BaseAPIHandler(ViseronRequestHandler):
                 if params is None:
                     params = {}
 
-                request_arguments = {
-                    k: self.get_argument(k) for k in self.request.arguments
-                }
                 if schema := route.get("request_arguments_schema", None):
+                    # Decode the last value of each argument directly instead of
+                    # going through get_argument, which builds a list of all values
+                    request_arguments = {
+                        key: self.decode_argument(values[-1], name=key).strip()
+                        for key, values in self.request.arguments.items()
+                        if values
+                    }
                     try:
                         self.request_arguments = schema(request_arguments)
                     except vol.Invalid as err:
                         LOGGER.error(
-                            f"Invalid request arguments: {request_arguments}",
+                            "Invalid request arguments: %s",
+                            request_arguments,
                             exc_info=True,
                         )
                         self.response_error(
@@ -236,10 +293,11 @@ class BaseAPIHandler(ViseronRequestHandler):
                         )
                         return
 
-                path_args = [param.decode() for param in params.get("path_args", [])]
-                path_kwargs = params.get("path_kwargs", {})
-                for key, value in path_kwargs.items():
-                    path_kwargs[key] = value.decode()
+                path_args = [param.decode() for param in params.get("path_args", ())]
+                path_kwargs = {
+                    key: value.decode()
+                    for key, value in params.get("path_kwargs", {}).items()
+                }
 
                 if self._webserver.auth and route.get("requires_camera_token", False):
                     camera_identifier = path_kwargs.get("camera_identifier", None)
@@ -269,16 +327,22 @@ class BaseAPIHandler(ViseronRequestHandler):
                     return
 
                 LOGGER.debug(
-                    f'Routing to {self.__class__.__name__}.{route["method"]}(*args={path_args}, **kwargs={path_kwargs}, request_arguments={self.request_arguments})'
+                    "Routing to %s.%s(*args=%s, **kwargs=%s, request_arguments=%s)",
+                    self.__class__.__name__,
+                    route["method"],
+                    path_args,
+                    path_kwargs,
+                    self.request_arguments,
                 )
                 try:
                     getattr(self, route["method"])(*path_args, **path_kwargs)
                     return
                 except Exception as error:  # pylint: disable=broad-except
                     LOGGER.error(
-                        f"Error in API {self.__class__.__name__}."
-                        f"{self.route['method']}: "
-                        f"{str(error)}",
+                        "Error in API %s.%s: %s",
+                        self.__class__.__name__,
+                        self.route["method"],
+                        error,
                         exc_info=True,
                     )
                     self.response_error(
@@ -287,10 +351,10 @@ class BaseAPIHandler(ViseronRequestHandler):
                     return
 
         if unsupported_method:
-            LOGGER.warning(f"Method not allowed for URI: {self.request.uri}")
+            LOGGER.warning("Method not allowed for URI: %s", self.request.uri)
             self.handle_method_not_allowed()
         else:
-            LOGGER.warning(f"Endpoint not found for URI: {self.request.uri}")
+            LOGGER.warning("Endpoint not found for URI: %s", self.request.uri)
             self.handle_endpoint_not_found()
 
     def delete(self) -> None:
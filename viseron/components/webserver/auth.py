@@ -10,6 +10,7 @@ import secrets
 import uuid
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
+from functools import cached_property
 from pathlib import Path
 from threading import Lock
 from typing import TYPE_CHECKING, Any, Literal, cast
@@ -69,6 +70,16 @@ class RefreshToken:
     used_at: float | None = None
     used_by: str | None = None
 
+    @cached_property
+    def token_bytes(self) -> bytes:
+        """Return token as bytes, for comparing against cookie values."""
+        return self.token.encode()
+
+    @cached_property
+    def static_asset_key_bytes(self) -> bytes:
+        """Return static asset key as bytes, for comparing against cookie values."""
+        return self.static_asset_key.encode()
+
 
 class Group(enum.Enum):
     """Group enum."""
@@ -145,6 +156,11 @@ class Auth:
                 assert self._users is not None
         return self._users
 
+    @property
+    def users_loaded(self) -> bool:
+        """Return True if users have been loaded from storage."""
+        return self._users is not None
+
     @property
     def refresh_tokens(self) -> dict[str, RefreshToken]:
         """Return refresh tokens."""
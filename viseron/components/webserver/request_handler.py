@@ -49,6 +49,12 @@ class ViseronRequestHandler(tornado.web.RequestHandler):
             return
 
         if _user := self.get_cookie("user"):
+            # Once users are loaded get_user is a dict lookup, only the first load
+            # reads from disk and needs the executor
+            if self._webserver.auth.users_loaded:
+                self.current_user = self._webserver.auth.get_user(_user)
+                return
+
             self.current_user = await self.run_in_executor(
                 self._webserver.auth.get_user, _user
             )
@@ -100,7 +106,6 @@ class ViseronRequestHandler(tornado.web.RequestHandler):
         # Refresh all cookies on every request if expiry is None because you can't have
         # infinite cookies in some browsers
         if new_session or self._webserver.auth.session_expiry is None:
-            self.clear_cookie("refresh_token")
             self.set_secure_cookie(
                 "refresh_token",
                 refresh_token.token,
@@ -109,7 +114,6 @@ class ViseronRequestHandler(tornado.web.RequestHandler):
                 samesite="strict",
                 secure=self.request.protocol == "https",
             )
-            self.clear_cookie("static_asset_key")
             self.set_secure_cookie(
                 "static_asset_key",
                 refresh_token.static_asset_key,
@@ -118,7 +122,6 @@ class ViseronRequestHandler(tornado.web.RequestHandler):
                 samesite="strict",
                 secure=self.request.protocol == "https",
             )
-            self.clear_cookie("user")
             self.set_cookie(
                 "user",
                 user.id,
@@ -126,7 +129,6 @@ class ViseronRequestHandler(tornado.web.RequestHandler):
                 samesite="strict",
                 secure=self.request.protocol == "https",
             )
-        self.clear_cookie("signature_cookie")
         self.set_secure_cookie(
             "signature_cookie",
             signature,
@@ -162,9 +164,7 @@ class ViseronRequestHandler(tornado.web.RequestHandler):
             if refresh_token_cookie is None:
                 LOGGER.debug("Refresh token is missing")
                 return
-            if not hmac.compare_digest(
-                refresh_token_cookie.decode(), refresh_token.token
-            ):
+            if not hmac.compare_digest(refresh_token_cookie, refresh_token.token_bytes):
                 LOGGER.debug("Access token does not belong to the refresh token.")
                 return False
 
@@ -214,17 +214,15 @@ class ViseronRequestHandler(tornado.web.RequestHandler):
         If failed is True, check for failed camera instances
         if the camera is not found.
         """
-        camera = None
-        try:
-            camera = self._vis.get_registered_domain(CAMERA_DOMAIN, camera_identifier)
-        except DomainNotRegisteredError:
-            if failed:
-                if domain_to_setup := (
-                    self._vis.data[DOMAIN_FAILED]
-                    .get(CAMERA_DOMAIN, {})
-                    .get(camera_identifier, None)
-                ):
-                    camera = domain_to_setup.error_instance
+        camera = self._vis.get_registered_domain_or_none(
+            CAMERA_DOMAIN, camera_identifier
+        )
+        if camera is None and failed:
+            failed_cameras = self._vis.data[DOMAIN_FAILED].get(CAMERA_DOMAIN)
+            if failed_cameras and (
+                domain_to_setup := failed_cameras.get(camera_identifier, None)
+            ):
+                camera = domain_to_setup.error_instance
         return camera
 
     def validate_camera_token(self, camera: AbstractCamera) -> bool:
@@ -239,7 +237,7 @@ class ViseronRequestHandler(tornado.web.RequestHandler):
                 refresh_token_cookie.decode()
             )
             if hmac.compare_digest(
-                refresh_token.static_asset_key, static_asset_key.decode()
+                refresh_token.static_asset_key_bytes, static_asset_key
             ):
                 return True
         return False
@@ -30,6 +30,8 @@ class ConnectionStatusBinarySensor(CameraBinarySensor):
         self.object_id = f"{camera.identifier}_connected"
         self.name = f"{camera.name} Connected"
 
+        self._last_connected: bool | None = None
+
     def setup(self) -> None:
         """Set up event listener."""
         self._vis.listen_event(
@@ -43,6 +45,11 @@ class ConnectionStatusBinarySensor(CameraBinarySensor):
 
     def handle_event(self, _event_data: Event[EventStatusData]) -> None:
         """Handle status event."""
+        connected = self._camera.connected
+        if connected == self._last_connected:
+            return
+
+        self._last_connected = connected
         self.set_state()
 
 
@@ -75,12 +82,18 @@ class RecorderBinarySensor(CameraBinarySensor):
 
     def handle_start_event(self, event_data: Event[EventRecorderData]) -> None:
         """Handle recorder start event."""
+        if self._is_on and self._recording is event_data.data.recording:
+            return
+
         self._recording = event_data.data.recording
         self._is_on = True
         self.set_state()
 
     def handle_stop_event(self, event_data: Event[EventRecorderData]) -> None:
         """Handle recorder stop event."""
+        if not self._is_on and self._recording is event_data.data.recording:
+            return
+
         self._recording = event_data.data.recording
         self._is_on = False
         self.set_state()
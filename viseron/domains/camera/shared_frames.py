@@ -70,7 +70,9 @@ class SharedFrames:
     def __init__(self) -> None:
         self._frames: dict[uuid.UUID | str, np.ndarray] = {}
 
-    def create(self, shared_frame: SharedFrame, frame_bytes: bytes) -> None:
+    def create(
+        self, shared_frame: SharedFrame, frame_bytes: bytes | np.ndarray
+    ) -> None:
         """Create frame in shared memory."""
         self._frames[shared_frame.name] = np.frombuffer(frame_bytes, np.uint8).reshape(
             shared_frame.color_plane_height, shared_frame.color_plane_width
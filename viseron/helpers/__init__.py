@@ -16,6 +16,11 @@ import tornado.queues as tq
 
 from viseron.const import FONT, FONT_SIZE, FONT_THICKNESS
 
+try:
+    import simplejpeg
+except ImportError:  # pragma: no cover
+    simplejpeg = None
+
 if TYPE_CHECKING:
     from viseron.domains.object_detector.detected_object import DetectedObject
 
@@ -50,6 +55,17 @@ def calculate_absolute_coords(
     )
 
 
+def calculate_absolute_coords_array(
+    bounding_boxes: np.ndarray, frame_res: tuple[int, int]
+) -> np.ndarray:
+    """Convert an array of relative coords with shape (N, 4) to absolute.
+
+    Same as calculate_absolute_coords, but for all bounding boxes at once.
+    """
+    width, height = frame_res
+    return np.floor(bounding_boxes * (width, height, width, height)).astype(int)
+
+
 def scale_bounding_box(
     image_size: tuple[int, int, int, int],
     bounding_box: tuple[int, int, int, int],
@@ -347,6 +363,43 @@ def letterbox_resize(image: np.ndarray, width, height):
     return output_image
 
 
+def encode_jpeg(image: np.ndarray, quality: int = 95) -> bytes | None:
+    """Encode a BGR image to JPEG bytes.
+
+    libjpeg-turbo is used through simplejpeg when available, which returns bytes
+    directly. Falls back to cv2.imencode otherwise.
+    Both paths favor encoding speed: the fast DCT is used with simplejpeg and the
+    extra Huffman table optimization pass is disabled for cv2.
+    """
+    if simplejpeg is not None:
+        return simplejpeg.encode_jpeg(
+            np.ascontiguousarray(image),
+            quality=quality,
+            colorspace="BGR",
+            colorsubsampling="420",
+            fastdct=True,
+        )
+
+    ret, jpg = cv2.imencode(
+        ".jpg",
+        image,
+        [int(cv2.IMWRITE_JPEG_QUALITY), quality, int(cv2.IMWRITE_JPEG_OPTIMIZE), 0],
+    )
+    if ret:
+        return jpg.tobytes()
+    return None
+
+
+def encode_ppm(image: np.ndarray) -> bytes:
+    """Encode a BGR image to binary PPM bytes.
+
+    PPM is an uncompressed format, so encoding is just a header and a memory copy.
+    """
+    height, width = image.shape[:2]
+    header = b"P6\n%d %d\n255\n" % (width, height)
+    return header + np.ascontiguousarray(image[..., ::-1]).tobytes()
+
+
 def convert_letterboxed_bbox(
     frame_width: int,
     frame_height: int,
@@ -5,6 +5,16 @@ import json
 from enum import Enum
 from typing import Any
 
+import orjson
+
+# Dataclasses and datetimes are passed to the default function so that they are
+# serialized the same way as with JSONEncoder
+ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+)
+
 
 class JSONEncoder(json.JSONEncoder):
     """Helper to convert objects to JSON."""
@@ -20,3 +30,26 @@ class JSONEncoder(json.JSONEncoder):
         if isinstance(o, datetime.timedelta):
             return int(o.total_seconds())
         return o.value if isinstance(o, Enum) else json.JSONEncoder.default(self, o)
+
+
+def _orjson_default(o: Any) -> Any:
+    """Convert objects not natively supported by orjson."""
+    if isinstance(o, datetime.datetime):
+        return o.isoformat()
+    if hasattr(o, "as_dict"):
+        return o.as_dict()
+    if dataclasses.is_dataclass(o):
+        return dataclasses.asdict(o)
+    if isinstance(o, datetime.timedelta):
+        return int(o.total_seconds())
+    if isinstance(o, Enum):
+        return o.value
+    raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize data to JSON bytes using orjson.
+
+    Handles the same objects as JSONEncoder.
+    """
+    return orjson.dumps(data, default=_orjson_default, option=ORJSON_OPTIONS)
@@ -2,12 +2,10 @@
 from __future__ import annotations
 
 import logging
+import threading
 from abc import ABC, abstractmethod
 
-from apscheduler.schedulers import (
-    SchedulerAlreadyRunningError,
-    SchedulerNotRunningError,
-)
+from apscheduler.schedulers import SchedulerNotRunningError
 from apscheduler.schedulers.background import BackgroundScheduler
 
 LOGGER = logging.getLogger(__name__)
@@ -16,15 +14,30 @@ LOGGER = logging.getLogger(__name__)
 class WatchDog(ABC):
     """A watchdog for long running items."""
 
-    registered_items: list = []
-    _scheduler = BackgroundScheduler(timezone="UTC", daemon=True)
+    # Registered items are stored as dict keys, which keeps insertion order and
+    # makes unregister O(1)
+    registered_items: dict = {}
+    # Guards registered_items, which is mutated from arbitrary threads while the
+    # watchdog iterates it
+    _registry_lock = threading.RLock()
+    # One scheduler is shared by all watchdogs. It is created on first use so that
+    # watchdogs which do not schedule jobs never start its thread
+    _scheduler: BackgroundScheduler | None = None
+    _scheduler_lock = threading.Lock()
 
-    def __init__(self) -> None:
-        try:
-            self._scheduler.start()
-            LOGGER.debug("Starting scheduler")
-        except SchedulerAlreadyRunningError:
-            pass
+    @classmethod
+    def _get_scheduler(cls) -> BackgroundScheduler:
+        """Return the shared scheduler, creating and starting it if needed."""
+        with WatchDog._scheduler_lock:
+            if WatchDog._scheduler is None:
+                WatchDog._scheduler = BackgroundScheduler(timezone="UTC", daemon=True)
+            # BackgroundScheduler.start replaces the wakeup event before checking if
+            # it is already running, which would leave the running thread waiting on
+            # an orphaned event and make shutdown hang
+            if not WatchDog._scheduler.running:
+                WatchDog._scheduler.start()
+                LOGGER.debug("Starting scheduler")
+            return WatchDog._scheduler
 
     @classmethod
     def register(
@@ -33,7 +46,8 @@ class WatchDog(ABC):
     ) -> None:
         """Register item in the watchdog."""
         LOGGER.debug(f"Registering {item} in the watchdog")
-        cls.registered_items.append(item)
+        with cls._registry_lock:
+            cls.registered_items[item] = None
 
     @classmethod
     def unregister(
@@ -42,10 +56,14 @@ class WatchDog(ABC):
     ) -> None:
         """Unregister item from the watchdog."""
         LOGGER.debug(f"Removing {item} from the watchdog")
-        try:
-            cls.registered_items.remove(item)
-        except ValueError:
-            pass
+        with cls._registry_lock:
+            cls.registered_items.pop(item, None)
+
+    @classmethod
+    def registered_items_snapshot(cls) -> list:
+        """Return a copy of the registered items that is safe to iterate."""
+        with cls._registry_lock:
+            return list(cls.registered_items)
 
     @abstractmethod
     def watchdog(self):
@@ -53,8 +71,11 @@ class WatchDog(ABC):
 
     def stop(self) -> None:
         """Stop the watchdog."""
-        try:
-            self._scheduler.shutdown()
-            LOGGER.debug("Stopping scheduler")
-        except SchedulerNotRunningError:
-            pass
+        with WatchDog._scheduler_lock:
+            if WatchDog._scheduler is None:
+                return
+            try:
+                WatchDog._scheduler.shutdown()
+                LOGGER.debug("Stopping scheduler")
+            except SchedulerNotRunningError:
+                pass
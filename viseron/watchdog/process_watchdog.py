@@ -1,14 +1,22 @@
 """Watchdog for long-running processes."""
 from __future__ import annotations
 
-import datetime
+import atexit
 import logging
 import multiprocessing as mp
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from viseron.watchdog import WatchDog
 
 LOGGER = logging.getLogger(__name__)
 
+WATCHDOG_INTERVAL = 15
+MAX_CONCURRENT_RESTARTS = 4
+# Upper bound for a restart is the terminate timeout plus the kill join
+RESTART_WAIT_TIMEOUT = 10
+
 
 class RestartableProcess:
     """A restartable process.
@@ -17,6 +25,20 @@ class RestartableProcess:
     process.
     """
 
+    __slots__ = (
+        "_args",
+        "_name",
+        "_grace_period",
+        "_kwargs",
+        "_ctx",
+        "_process",
+        "_started",
+        "_start_time",
+        "_grace_deadline",
+        "_register",
+        "_restart_lock",
+    )
+
     def __init__(
         self, *args, name=None, grace_period=20, register=True, **kwargs
     ) -> None:
@@ -24,15 +46,24 @@ class RestartableProcess:
         self._name = name
         self._grace_period = grace_period
         self._kwargs = kwargs
+        self._ctx = mp.get_context()
         self._process: mp.Process | None = None
         self._started = False
         self._start_time: float | None = None
+        self._grace_deadline: float | None = None
         self._register = register
+        self._restart_lock = threading.Lock()
 
     def __getattr__(self, attr):
-        """Forward all undefined attribute calls to mp.Process."""
-        if attr in self.__class__.__dict__:
-            return getattr(self, attr)
+        """Forward all undefined attribute calls to mp.Process.
+
+        Private attributes are never forwarded, which also stops the lookup of
+        _process from recursing if it has not been set yet.
+        """
+        if attr.startswith("_") or self._process is None:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{attr}'"
+            )
         return getattr(self._process, attr)
 
     @property
@@ -57,9 +88,24 @@ class RestartableProcess:
 
     @property
     def start_time(self) -> float | None:
-        """Return process start time."""
+        """Return process start time in time.monotonic() seconds."""
         return self._start_time
 
+    @property
+    def grace_deadline(self) -> float | None:
+        """Return the time.monotonic() seconds when the grace period ends."""
+        return self._grace_deadline
+
+    @property
+    def pid(self) -> int | None:
+        """Return process pid."""
+        return self._process.pid if self._process else None
+
+    @property
+    def sentinel(self) -> int | None:
+        """Return process sentinel."""
+        return self._process.sentinel if self._process else None
+
     @property
     def exitcode(self) -> int | None:
         """Return process exit code."""
@@ -67,24 +113,37 @@ class RestartableProcess:
 
     def start(self) -> None:
         """Start the process."""
-        self._process = mp.Process(
+        self._process = self._ctx.Process(
             *self._args,
             **self._kwargs,
         )
-        self._start_time = datetime.datetime.now().timestamp()
+        self._start_time = time.monotonic()
+        self._grace_deadline = self._start_time + self._grace_period
         self._started = True
         self._process.start()
         if self._register:
             ProcessWatchDog.register(self)
 
-    def restart(self, timeout: float | None = None) -> None:
-        """Restart the process."""
-        self._started = False
-        if self._process:
-            self._process.terminate()
-            self._process.join(timeout=timeout)
-            self._process.kill()
-        self.start()
+    def restart(self, timeout: float = 5.0) -> None:
+        """Restart the process.
+
+        A running process is terminated and killed if it has not exited within
+        timeout seconds.
+        """
+        with self._restart_lock:
+            self._started = False
+            if self._process:
+                # The watchdog only restarts processes that have already exited
+                if self._process.is_alive():
+                    self._process.terminate()
+                    self._process.join(timeout=timeout)
+                    if self._process.is_alive():
+                        self._process.kill()
+                        self._process.join(timeout=1)
+                if not self._process.is_alive():
+                    # Release the sentinel and Popen object now instead of on GC
+                    self._process.close()
+            self.start()
 
     def is_alive(self) -> bool:
         """Return if the process is alive."""
@@ -113,27 +172,81 @@ class RestartableProcess:
 class ProcessWatchDog(WatchDog):
     """A watchdog for long running processes."""
 
-    registered_items: list[RestartableProcess] = []
+    registered_items: dict[RestartableProcess, None] = {}
 
     def __init__(self) -> None:
         super().__init__()
-        self._scheduler.add_job(self.watchdog, "interval", seconds=15)
+        self._restart_pool = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_RESTARTS,
+            thread_name_prefix=f"{__name__}.restart",
+        )
+        # A single callback every interval does not need a scheduler job, so the
+        # watchdog runs in its own thread
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"{__name__}.watchdog", daemon=True
+        )
+        self._thread.start()
+        # Stop before interpreter shutdown reaps the child processes, so they are
+        # not restarted while exiting
+        atexit.register(self.stop)
+
+    def _run(self) -> None:
+        """Run the watchdog every WATCHDOG_INTERVAL seconds until stopped."""
+        while not self._stop_event.wait(WATCHDOG_INTERVAL):
+            self.watchdog()
+
+    def stop(self) -> None:
+        """Stop the watchdog."""
+        self._stop_event.set()
+        self._restart_pool.shutdown(wait=False, cancel_futures=True)
+        atexit.unregister(self.stop)
 
     def watchdog(self) -> None:
         """Check for stopped processes and restart them."""
-        for registered_process in self.registered_items:
+        now = time.monotonic()
+        dead_processes: list[RestartableProcess] = []
+        registered_process: RestartableProcess
+        for registered_process in self.registered_items_snapshot():
+            if self._stop_event.is_set():
+                return
             if not registered_process.started:
                 continue
-            if registered_process.is_alive():
+            # Processes inside their grace period are never restarted, so check the
+            # grace period first to skip probing them
+            grace_deadline = registered_process.grace_deadline
+            if grace_deadline is not None and now < grace_deadline:
                 continue
-
-            now = datetime.datetime.now().timestamp()
-            if (
-                registered_process.start_time
-                and now - registered_process.start_time
-                < registered_process.grace_period
-            ):
+            if registered_process.is_alive():
                 continue
-
-            LOGGER.error(f"Process {registered_process.name} has exited, restarting")
-            registered_process.restart()
+            dead_processes.append(registered_process)
+
+        if not dead_processes:
+            return
+
+        # Log once per tick, even if many processes died at the same time
+        if len(dead_processes) == 1:
+            LOGGER.error("Process %s has exited, restarting", dead_processes[0].name)
+        else:
+            LOGGER.error(
+                "%d processes have exited, restarting: %s",
+                len(dead_processes),
+                ", ".join(str(dead_process.name) for dead_process in dead_processes),
+            )
+
+        if self._stop_event.is_set():
+            return
+        # Restart in parallel so the wall time is that of the slowest restart, and
+        # wait for them so the next tick does not overlap
+        futures = {
+            self._restart_pool.submit(dead_process.restart): dead_process
+            for dead_process in dead_processes
+        }
+        done, _ = wait(futures, timeout=RESTART_WAIT_TIMEOUT)
+        for future in done:
+            if exception := future.exception():
+                LOGGER.error(
+                    "Failed to restart process %s",
+                    futures[future].name,
+                    exc_info=exception,
+                )
@@ -94,15 +94,15 @@ class RestartablePopen:
 class SubprocessWatchDog(WatchDog):
     """A watchdog for long running processes."""
 
-    registered_items: list[RestartablePopen] = []
+    registered_items: dict[RestartablePopen, None] = {}
 
     def __init__(self) -> None:
         super().__init__()
-        self._scheduler.add_job(self.watchdog, "interval", seconds=15)
+        self._get_scheduler().add_job(self.watchdog, "interval", seconds=15)
 
     def watchdog(self) -> None:
         """Check for stopped processes and restart them."""
-        for registered_process in self.registered_items:
+        for registered_process in self.registered_items_snapshot():
             if not registered_process.started:
                 continue
             if registered_process.subprocess.poll() is None:
@@ -178,18 +178,18 @@ class RestartableThread(threading.Thread):
 class ThreadWatchDog(WatchDog):
     """A watchdog for long running threads."""
 
-    registered_items: List[RestartableThread] = []
+    registered_items: Dict[RestartableThread, None] = {}
 
     def __init__(self) -> None:
         super().__init__()
-        self._scheduler.add_job(self.watchdog, "interval", seconds=15)
+        self._get_scheduler().add_job(self.watchdog, "interval", seconds=15)
 
     def watchdog(self) -> None:
         """Check for stopped threads and restart them."""
         new_threads: List[RestartableThread] = []
         deleted_threads: List[RestartableThread] = []
         registered_thread: RestartableThread
-        for registered_thread in self.registered_items.copy():
+        for registered_thread in self.registered_items_snapshot():
             if not registered_thread.started:
                 continue
 
@@ -223,7 +223,8 @@ class ThreadWatchDog(WatchDog):
                 new_threads.append(new_thread)
                 deleted_threads.append(registered_thread)
 
-        for thread in new_threads:
-            self.registered_items.append(thread)
-        for thread in deleted_threads:
-            self.registered_items.remove(thread)
+        with self._registry_lock:
+            for thread in new_threads:
+                self.registered_items[thread] = None
+            for thread in deleted_threads:
+                self.registered_items.pop(thread, None)